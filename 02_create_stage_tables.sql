@@ -146,7 +146,7 @@ CREATE OR REPLACE TABLE STG_EMPLOYEES (
 );
 
 -- 9. SALES TERRITORIES STAGE TABLE
-CREATE OR REPLACE TABLE up (
+CREATE OR REPLACE TABLE STG_TERRITORIES (
     TERRITORY_ID NUMBER,
     TERRITORY_NAME STRING,
     REGION STRING,
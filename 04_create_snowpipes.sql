@@ -189,7 +189,7 @@ ON_ERROR = 'CONTINUE';
 CREATE OR REPLACE PIPE PIPE_SALES_TERRITORIES
 AUTO_INGEST = TRUE
 AS
-COPY INTO SNOWPIPE_DT_DEMO.STAGE_DATA.STG_SALES_TERRITORIES
+COPY INTO SNOWPIPE_DT_DEMO.STAGE_DATA.STG_TERRITORIES
 FROM @SNOWPIPE_DT_DEMO.DEMO_STAGES.STG_SALES_TERRITORIES_FILES/
 FILE_FORMAT = (
     TYPE = 'JSON'
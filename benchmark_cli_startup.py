@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+CLI Startup Benchmark for Snowpipe + Streams + Tasks Demo
+
+Lightweight `snowpipe-demo` subcommands must start fast and must not
+import heavy modules. For each lightweight command this script:
+1. Runs it --runs times in a fresh interpreter and takes the median wall time
+2. Subtracts the median of a bare `python -c pass`, so the budget only covers
+   what snowpipe-demo itself adds (imports, argument parsing, the work)
+3. Runs it once under `python -X importtime` and lists any heavy module loaded
+4. Fails (exit 1) when the overhead exceeds --budget-ms, a heavy module shows up,
+   or the command exits unexpectedly (a traceback, or a code outside EXPECTED_EXIT)
+
+Usage: python benchmark_cli_startup.py [--budget-ms 100] [--runs 10]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+LIGHTWEIGHT_COMMANDS = [
+    ["--help"],
+    ["validate"],
+    ["upload"],
+]
+# validate / upload return 1 when the data directory is empty or has bad files
+EXPECTED_EXIT = {"--help": {0}, "validate": {0, 1}, "upload": {0, 1}}
+HEAVY_MODULES = ("faker", "numpy", "pandas", "duckdb", "snowflake")
+
+
+def run_once(argv):
+    """Wall time, return code and stderr of one fresh `python <argv>` process."""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, *argv], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            text=True, check=False)
+    return time.perf_counter() - start, result.returncode, result.stderr
+
+
+def unexpected_exit(command, returncode, stderr):
+    """Why a run does not count as a clean start, or None."""
+    if "Traceback (most recent call last)" in stderr:
+        return "traceback"
+    if returncode not in EXPECTED_EXIT[command[0]]:
+        return f"exit {returncode}"
+    return None
+
+
+def heavy_imports(command):
+    """Top-level packages from HEAVY_MODULES that `command` imports."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-m", "snowpipe_demo", *command],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False)
+    loaded = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            module = line.rsplit("|", 1)[1].strip().split(".")[0]
+            if module in HEAVY_MODULES:
+                loaded.add(module)
+    return sorted(loaded)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure snowpipe-demo startup for lightweight subcommands")
+    parser.add_argument("--budget-ms", type=float, default=100,
+                        help="Maximum median time per command on top of bare interpreter startup")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per command")
+    args = parser.parse_args()
+
+    baseline = statistics.median(run_once(["-c", "pass"])[0] for _ in range(args.runs))
+    print(f"⏱️  Bare interpreter startup: {baseline * 1000:.1f} ms (budget +{args.budget_ms:.0f} ms per command)\n")
+    print(f"{'COMMAND':<24}{'MEDIAN ms':>10}{'OVERHEAD ms':>13}  HEAVY IMPORTS / ERRORS")
+
+    failures = 0
+    for command in LIGHTWEIGHT_COMMANDS:
+        runs = [run_once(["-m", "snowpipe_demo", *command]) for _ in range(args.runs)]
+        median = statistics.median(elapsed for elapsed, _, _ in runs) * 1000
+        overhead = median - baseline * 1000
+        problems = heavy_imports(command)
+        problems += sorted({reason for _, code, err in runs if (reason := unexpected_exit(command, code, err))})
+        over_budget = overhead > args.budget_ms
+        failures += over_budget or bool(problems)
+        status = "❌" if over_budget or problems else "✅"
+        print(f"{' '.join(command):<24}{median:>10.1f}{overhead:>13.1f}  "
+              f"{', '.join(problems) or '-'} {status}")
+
+    if failures:
+        raise SystemExit(f"\n❌ {failures} commands over budget, loading heavy modules or exiting unexpectedly")
+    print("\n🎉 All lightweight subcommands within budget")
+
+
+if __name__ == "__main__":
+    main()
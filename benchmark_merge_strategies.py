@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Offline MERGE Dedupe Strategy Benchmark for Snowpipe + Streams + Tasks Demo
+
+The tasks in fix_merge_operations.sql dedupe each stream with a nested
+ROW_NUMBER() subquery (rn = 1) and only update when
+target.DATA_VERSION < source.DATA_VERSION. This script reads those MERGE
+statements, translates them to an embedded engine and times alternative
+dedupe strategies over generated stage data:
+
+1. row_number - the current nested ROW_NUMBER() ... WHERE rn = 1 subquery
+2. qualify    - QUALIFY ROW_NUMBER() ... = 1 (DuckDB only)
+3. max_by     - one aggregate per key (DuckDB arg_max / SQLite bare-column MAX)
+4. prefilter  - row_number, after dropping stage rows not newer than the target
+
+The MERGE itself becomes INSERT ... ON CONFLICT DO UPDATE ... WHERE
+target.DATA_VERSION < excluded.DATA_VERSION, which has the same WHEN MATCHED /
+WHEN NOT MATCHED behaviour. Each run happens inside a rolled-back transaction
+and its final state is checked against row_number. Besides the time, each
+run reports SOURCE (rows the dedupe hands to the upsert, where the strategies
+differ in work) and TOUCHED (rows changed in LATEST, equal for every correct
+strategy).
+
+Usage: python benchmark_merge_strategies.py [--engine duckdb|sqlite]
+           [--entities CUSTOMERS,PRODUCTS] [--table-sizes 1000,10000] [--batch-sizes 100,1000]
+"""
+
+import argparse
+import csv
+import random
+import re
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+MERGE_SQL = Path(__file__).with_name("fix_merge_operations.sql")
+ORDER_BY = "DATA_VERSION DESC, RECORD_TIMESTAMP DESC, LOAD_TIMESTAMP DESC"
+
+# =============================================================================
+# ENTITY SPECS FROM fix_merge_operations.sql
+# =============================================================================
+MERGE_PATTERN = re.compile(
+    r"MERGE INTO \S+\.(LATEST_\w+) AS target\s+USING \(\s*SELECT(.*?)FROM \(.*?"
+    r"PARTITION BY (\w+).*?FROM (STG_\w+)_STREAM",
+    re.DOTALL,
+)
+
+
+def load_entity_specs():
+    """{entity: (stage table, latest table, key column, [columns])} per MERGE task."""
+    specs = {}
+    for latest, columns, key, stage in MERGE_PATTERN.findall(MERGE_SQL.read_text()):
+        columns = [c.strip() for c in columns.split(",") if c.strip()]
+        specs[latest[len("LATEST_"):]] = (stage, latest, key, columns)
+    return specs
+
+# =============================================================================
+# STAGE DATA
+# =============================================================================
+def _row(columns, key, key_value, version, now):
+    row = {}
+    for column in columns:
+        if column == key:
+            row[column] = key_value
+        elif column == "DATA_VERSION":
+            row[column] = version
+        elif column in ("RECORD_TIMESTAMP", "LOAD_TIMESTAMP"):
+            # Fixed-width ISO text so string order == time order on every engine
+            row[column] = (now - timedelta(seconds=random.randint(0, 86400))).strftime("%Y-%m-%dT%H:%M:%S.%f")
+        else:
+            row[column] = f"{column.lower()}-{random.randint(1, 10**6)}"
+    return [row[column] for column in columns]
+
+
+def generate_target(columns, key, table_size, now):
+    return [_row(columns, key, i, random.randint(1, 3), now) for i in range(1, table_size + 1)]
+
+
+def generate_batch(columns, key, table_size, batch_size, now):
+    """
+    Stream batch shaped like the update files: mostly changes to existing keys
+    (several versions per key, some stale), the rest brand new keys.
+    """
+    rows = []
+    hot_keys = max(1, batch_size // 3)
+    existing = random.sample(range(1, table_size + 1), min(table_size, hot_keys))
+    for _ in range(batch_size * 4 // 5):
+        rows.append(_row(columns, key, random.choice(existing), random.randint(1, 5), now))
+    for new_key in range(table_size + 1, table_size + 1 + batch_size - len(rows)):
+        rows.append(_row(columns, key, new_key, 1, now))
+    return rows
+
+# =============================================================================
+# ENGINES
+# =============================================================================
+class SqliteEngine:
+    name = "sqlite"
+    strategies = ("row_number", "max_by", "prefilter")
+
+    def __init__(self):
+        self.conn = sqlite3.connect(":memory:", isolation_level=None)
+
+    def execute(self, sql, params=()):
+        return self.conn.execute(sql, params)
+
+    def load(self, table, columns, rows):
+        self.execute("BEGIN")
+        self.conn.executemany(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})", rows
+        )
+        self.execute("COMMIT")
+
+    def begin(self):
+        self.execute("BEGIN")
+
+    def rollback(self):
+        self.execute("ROLLBACK")
+
+    def max_by(self, stage, key, columns):
+        # SQLite returns the bare columns of the row holding MAX() within each group
+        sort_key = "printf('%010d', DATA_VERSION) || RECORD_TIMESTAMP || LOAD_TIMESTAMP"
+        return (f"SELECT {', '.join(columns)} FROM (SELECT {', '.join(columns)}, MAX({sort_key}) "
+                f"FROM {stage} GROUP BY {key})")
+
+
+class DuckdbEngine:
+    name = "duckdb"
+    strategies = ("row_number", "qualify", "max_by", "prefilter")
+
+    def __init__(self):
+        import duckdb
+        self.conn = duckdb.connect(":memory:")
+
+    def execute(self, sql, params=()):
+        return self.conn.execute(sql, params)
+
+    def load(self, table, columns, rows):
+        # executemany is row-at-a-time in DuckDB; bulk COPY from a temp CSV instead
+        with tempfile.NamedTemporaryFile("w", newline="", suffix=".csv") as f:
+            csv.writer(f).writerows(rows)
+            f.flush()
+            self.execute(f"COPY {table} ({', '.join(columns)}) FROM '{f.name}' (HEADER false)")
+
+    def begin(self):
+        self.conn.begin()
+
+    def rollback(self):
+        self.conn.rollback()
+
+    def max_by(self, stage, key, columns):
+        return (f"SELECT UNNEST(arg_max({stage}, (DATA_VERSION, RECORD_TIMESTAMP, LOAD_TIMESTAMP))) "
+                f"FROM {stage} GROUP BY {key}")
+
+
+def get_engine(name):
+    if name == "auto":
+        try:
+            return DuckdbEngine()
+        except ImportError:
+            return SqliteEngine()
+    return {"sqlite": SqliteEngine, "duckdb": DuckdbEngine}[name]()
+
+# =============================================================================
+# STRATEGIES
+# =============================================================================
+def source_query(strategy, engine, stage, latest, key, columns):
+    cols = ", ".join(columns)
+    window = f"ROW_NUMBER() OVER (PARTITION BY {key} ORDER BY {ORDER_BY})"
+    if strategy == "row_number":
+        return f"SELECT {cols} FROM (SELECT {cols}, {window} AS rn FROM {stage}) WHERE rn = 1"
+    if strategy == "qualify":
+        return f"SELECT {cols} FROM {stage} QUALIFY {window} = 1"
+    if strategy == "max_by":
+        return engine.max_by(stage, key, columns)
+    if strategy == "prefilter":
+        newer = (f"SELECT * FROM {stage} s WHERE NOT EXISTS (SELECT 1 FROM {latest} t "
+                 f"WHERE t.{key} = s.{key} AND t.DATA_VERSION >= s.DATA_VERSION)")
+        return f"SELECT {cols} FROM (SELECT {cols}, {window} AS rn FROM ({newer})) WHERE rn = 1"
+    raise ValueError(f"Unknown strategy '{strategy}'")
+
+
+def merge_statement(source, latest, key, columns):
+    """MERGE ... WHEN MATCHED AND older THEN UPDATE / WHEN NOT MATCHED THEN INSERT, as an upsert."""
+    updates = ", ".join(f"{c} = excluded.{c}" for c in columns + ["STREAM_PROCESSED_AT"] if c != key)
+    return (f"INSERT INTO {latest} ({', '.join(columns)}, STREAM_PROCESSED_AT) "
+            f"SELECT {', '.join(columns)}, ? FROM ({source}) AS source WHERE true "
+            f"ON CONFLICT ({key}) DO UPDATE SET {updates} "
+            f"WHERE {latest}.DATA_VERSION < excluded.DATA_VERSION")
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+def setup_tables(engine, stage, latest, key, columns, target_rows, batch_rows):
+    typed = ", ".join(f"{c} {'INTEGER' if c in (key, 'DATA_VERSION') else 'VARCHAR'}" for c in columns)
+    engine.execute(f"DROP TABLE IF EXISTS {stage}")
+    engine.execute(f"DROP TABLE IF EXISTS {latest}")
+    engine.execute(f"CREATE TABLE {stage} ({typed})")
+    engine.execute(f"CREATE TABLE {latest} ({typed}, STREAM_PROCESSED_AT INTEGER, PRIMARY KEY ({key}))")
+    engine.load(stage, columns, batch_rows)
+    engine.load(latest, columns, target_rows)
+
+
+def run_strategy(engine, strategy, run_id, stage, latest, key, columns):
+    """Time one MERGE inside a rolled-back transaction; returns (seconds, source rows, rows touched, state)."""
+    source = source_query(strategy, engine, stage, latest, key, columns)
+    sql = merge_statement(source, latest, key, columns)
+    source_rows = engine.execute(f"SELECT COUNT(*) FROM ({source}) AS source").fetchone()[0]
+    engine.begin()
+    try:
+        start = time.perf_counter()
+        engine.execute(sql, (run_id,))
+        elapsed = time.perf_counter() - start
+        touched = engine.execute(f"SELECT COUNT(*) FROM {latest} WHERE STREAM_PROCESSED_AT = ?", (run_id,)).fetchone()[0]
+        state = engine.execute(
+            f"SELECT {key}, DATA_VERSION, RECORD_TIMESTAMP, LOAD_TIMESTAMP FROM {latest} ORDER BY {key}"
+        ).fetchall()
+    finally:
+        engine.rollback()
+    return elapsed, source_rows, touched, [tuple(row) for row in state]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MERGE dedupe strategies on an embedded SQL engine")
+    parser.add_argument("--engine", default="auto", choices=["auto", "duckdb", "sqlite"])
+    parser.add_argument("--entities", help="Comma-separated entities (default: every MERGE task)")
+    parser.add_argument("--table-sizes", default="1000,10000,100000", help="Rows preloaded in LATEST_*")
+    parser.add_argument("--batch-sizes", default="100,1000,10000", help="Rows in each stream batch")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per strategy (best is kept)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    engine = get_engine(args.engine)
+    specs = load_entity_specs()
+    if args.entities:
+        requested = args.entities.upper().split(",")
+        unknown = [e for e in requested if e not in specs]
+        if unknown:
+            parser.error(f"unknown entities: {', '.join(unknown)} (choose from {', '.join(specs)})")
+        specs = {e: specs[e] for e in requested}
+    table_sizes = [int(n) for n in args.table_sizes.split(",")]
+    batch_sizes = [int(n) for n in args.batch_sizes.split(",")]
+    now = datetime.now()
+
+    print(f"⏱️  MERGE strategies on {engine.name}: {', '.join(engine.strategies)}")
+    print(f"📋 {len(specs)} entities from {MERGE_SQL.name}\n")
+    print(f"{'ENTITY':<14}{'TABLE':>9}{'BATCH':>8}  {'STRATEGY':<12}{'MS':>9}{'SOURCE':>9}{'TOUCHED':>9}{'VS ROW_NUMBER':>15}")
+
+    run_id = 0
+    totals = {strategy: 0.0 for strategy in engine.strategies}
+    mismatches = 0
+    for entity, (stage, latest, key, columns) in specs.items():
+        for table_size in table_sizes:
+            target_rows = generate_target(columns, key, table_size, now)
+            for batch_size in batch_sizes:
+                batch_rows = generate_batch(columns, key, table_size, batch_size, now)
+                setup_tables(engine, stage, latest, key, columns, target_rows, batch_rows)
+
+                baseline_time, baseline_state = None, None
+                for strategy in engine.strategies:
+                    best = float("inf")
+                    for _ in range(args.repeat):
+                        run_id += 1
+                        elapsed, source_rows, touched, state = run_strategy(
+                            engine, strategy, run_id, stage, latest, key, columns)
+                        best = min(best, elapsed)
+                    if baseline_state is None:
+                        baseline_time, baseline_state = best, state
+                    same = state == baseline_state
+                    mismatches += not same
+                    totals[strategy] += best
+                    print(f"{entity:<14}{table_size:>9,}{batch_size:>8,}  {strategy:<12}{best * 1000:>9.2f}"
+                          f"{source_rows:>9,}{touched:>9,}{best / baseline_time:>14.2f}x{'' if same else '  ❌ DIFFERENT RESULT'}")
+
+    print(f"\n📊 TOTAL TIME PER STRATEGY:")
+    for strategy, total in sorted(totals.items(), key=lambda item: item[1]):
+        print(f"   {strategy:<12}{total * 1000:>10.1f} ms  ({total / totals['row_number']:.2f}x row_number)")
+
+    if mismatches:
+        raise SystemExit(f"❌ {mismatches} runs produced a different LATEST state than row_number")
+    print("✅ Every strategy produced the same LATEST state as row_number")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Serializer Benchmark for Snowpipe + Streams + Tasks Demo
+
+Compares the JSON backends in snowpipe_demo/serializers.py on the records in sample_data/:
+1. Loads every entity (initial + update files) and turns RECORD_TIMESTAMP
+   back into a datetime, exactly as the generators now produce it
+2. Repeats the records --scale times to get a measurable workload
+3. Writes each entity to a temp directory with every available backend
+4. Re-parses the output and checks it is identical to the legacy indent=2 files
+5. Reports throughput and bytes on disk per entity. Throughput is records/sec
+   and MB/sec of the same input (the pretty byte count), so backends that
+   write less whitespace are not penalized for producing fewer bytes
+
+Usage: python benchmark_serializers.py [--scale 50] [--repeat 3]
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from snowpipe_demo.serializers import SERIALIZERS, get_serializer, write_records
+
+data_dir = Path("sample_data")
+
+# =============================================================================
+# WORKLOAD
+# =============================================================================
+def load_workload(scale):
+    """Group sample_data records by entity and repeat them `scale` times."""
+    entities = {}
+    for filepath in sorted(data_dir.glob("*.json")):
+        entity = filepath.stem.split("_update_")[0]
+        with open(filepath) as f:
+            entities.setdefault(entity, []).extend(json.load(f))
+
+    workload = {}
+    for entity, records in entities.items():
+        for record in records:
+            record["RECORD_TIMESTAMP"] = datetime.fromisoformat(record["RECORD_TIMESTAMP"])
+        workload[entity] = records * scale
+    return workload
+
+
+def available_serializers():
+    serializers = []
+    for name in SERIALIZERS:
+        try:
+            serializers.append(get_serializer(name))
+        except ImportError:
+            print(f"⚠️  Skipping {name}: backend not installed")
+    return serializers
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+def run_backend(serializer, workload, out_dir, repeat):
+    """Best-of-`repeat` wall time for writing every entity, plus bytes per entity."""
+    best = float("inf")
+    sizes = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for entity, records in workload.items():
+            sizes[entity] = write_records(out_dir / f"{entity}.json", records, serializer)
+        best = min(best, time.perf_counter() - start)
+    return best, sizes
+
+
+def verify_output(out_dir, expected):
+    """Parsed output must match the parsed legacy output for every entity."""
+    for entity, records in expected.items():
+        with open(out_dir / f"{entity}.json", "rb") as f:
+            if json.load(f) != records:
+                return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON serializers on sample_data records")
+    parser.add_argument("--scale", type=int, default=50, help="Repeat each entity's records N times")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per backend (best is kept)")
+    args = parser.parse_args()
+
+    workload = load_workload(args.scale)
+    if not workload:
+        print(f"❌ No JSON files found in {data_dir}/ - run generate_initial_data.py first")
+        return
+
+    total_records = sum(len(records) for records in workload.values())
+    print(f"⏱️  Benchmarking serializers: {len(workload)} entities, {total_records:,} records\n")
+
+    # Legacy reference: what json.dump(indent=2) of .isoformat() strings parses back to
+    expected = {
+        entity: json.loads(json.dumps(records, default=datetime.isoformat))
+        for entity, records in workload.items()
+    }
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for serializer in available_serializers():
+            out_dir = Path(tmp) / serializer.name
+            out_dir.mkdir()
+            elapsed, sizes = run_backend(serializer, workload, out_dir, args.repeat)
+            identical = verify_output(out_dir, expected)
+            results.append((serializer.name, elapsed, sizes, identical))
+
+    baseline = next(sizes for name, _, sizes, _ in results if name == "pretty")
+    input_bytes = sum(baseline.values())
+
+    print(f"{'BACKEND':<10}{'SECONDS':>10}{'RECORDS/SEC':>13}{'INPUT MB/SEC':>14}{'TOTAL MB':>10}{'VS PRETTY':>11}"
+          f"  IDENTICAL")
+    for name, elapsed, sizes, identical in results:
+        total = sum(sizes.values())
+        print(f"{name:<10}{elapsed:>10.3f}{total_records / elapsed:>13,.0f}{input_bytes / elapsed / 1e6:>14.1f}"
+              f"{total / 1e6:>10.2f}{total / input_bytes:>10.0%}  {'✅' if identical else '❌'}")
+    print("\nINPUT MB/SEC = pretty-format bytes of the workload per second, the same numerator for every backend")
+
+    print(f"\n📁 BYTES ON DISK PER ENTITY (bytes/record in parentheses):")
+    print(f"{'ENTITY':<20}" + "".join(f"{name:>20}" for name, *_ in results))
+    for entity, records in workload.items():
+        row = "".join(f"{sizes[entity]:>12,} ({sizes[entity] / len(records):>4.0f})" for _, _, sizes, _ in results)
+        print(f"{entity:<20}{row}")
+
+    if not all(identical for *_, identical in results):
+        raise SystemExit("❌ Parsed content differs from legacy output")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""
+Snowpipe + Streams + Tasks Demo tooling.
+
+Everything is reachable through the `snowpipe-demo` console command
+(see snowpipe_demo/cli.py). Keep this module free of imports so the CLI
+only loads what a subcommand needs.
+"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,3 @@
+from snowpipe_demo.cli import main
+
+raise SystemExit(main())
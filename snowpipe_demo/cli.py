@@ -0,0 +1,161 @@
+"""
+`snowpipe-demo` command line entry point.
+
+Subcommands:
+  generate-initial   100 records per dataset (IDs 1-100, DATA_VERSION = 1)
+  generate-updates   10 updates + 10 new records per dataset, timestamped files
+  validate           check generated files before they are uploaded
+  upload             print PUT commands for the internal stages
+  compact            rewrite existing files with a compact serializer
+  orchestrate        full reset-and-reload cycle as a concurrent DAG
+  check-replay       replay batch sequences offline and check LATEST stays identical
+
+Only argparse is imported up front. Each subcommand imports its own module
+when it runs, so lightweight commands never pay for Faker (or anything else
+heavy) at startup - this CLI is called from tight orchestration loops.
+"""
+
+import argparse
+
+from snowpipe_demo import __version__
+
+DEFAULT_DATA_DIR = "sample_data"
+SERIALIZER_CHOICES = ["auto", "pretty", "compact", "orjson"]
+# Mirrors scenarios.SCENARIOS, kept here so parsing does not import anything
+SCENARIO_CHOICES = ["clean", "redelivery", "duplicate_rows", "late_arrivals", "chaos"]
+
+
+# =============================================================================
+# SUBCOMMAND HANDLERS (lazy imports)
+# =============================================================================
+def _generate_initial(args):
+    from snowpipe_demo import initial_data
+    return initial_data.main(args.data_dir, args.serializer, args.seed)
+
+
+def _generate_updates(args):
+    from snowpipe_demo import update_data
+    return update_data.main(args.data_dir, args.serializer, args.seed, args.scenario,
+                            args.duplicate_file_rate, args.duplicate_row_rate, args.late_arrival_rate)
+
+
+def _validate(args):
+    from snowpipe_demo import validate
+    return validate.main(args.data_dir)
+
+
+def _upload(args):
+    from snowpipe_demo import upload
+    if args.late_only:
+        return upload.main(args.data_dir, False, False, args.output, late=True)
+    return upload.main(args.data_dir, not args.updates_only, not args.initial_only, args.output)
+
+
+def _compact(args):
+    from snowpipe_demo import compact
+    return compact.main(args.data_dir, args.serializer, args.dry_run)
+
+
+def _orchestrate(args):
+    from snowpipe_demo import orchestrate
+    return orchestrate.main(args.data_dir, args.serializer, args.connector, args.max_workers,
+                            args.latency_ms, args.compare_serial, args.sql_dir)
+
+
+def _check_replay(args):
+    from snowpipe_demo import replay
+    return replay.main(args.data_dir, args.scenario, args.updates, args.seed, args.update_seed, args.from_files,
+                       args.duplicate_file_rate, args.duplicate_row_rate, args.late_arrival_rate)
+
+
+# =============================================================================
+# ARGUMENT PARSING
+# =============================================================================
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def _rate(value):
+    rate = float(value)
+    if not 0.0 <= rate <= 1.0:
+        raise argparse.ArgumentTypeError(f"must be between 0 and 1, got {value}")
+    return rate
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="snowpipe-demo", description="Snowpipe + Streams + Tasks demo tooling")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_rates(sub):
+        sub.add_argument("--duplicate-file-rate", type=_rate, help="Chance a file is delivered twice (0-1)")
+        sub.add_argument("--duplicate-row-rate", type=_rate, help="Chance a row is repeated in its file (0-1)")
+        sub.add_argument("--late-arrival-rate", type=_rate,
+                         help="Chance an update is followed by a stale lower DATA_VERSION copy (0-1)")
+
+    def add(name, handler, help_text, data_dir=DEFAULT_DATA_DIR, data_dir_help="Directory holding the JSON files"):
+        sub = subparsers.add_parser(name, help=help_text, description=help_text)
+        sub.add_argument("--data-dir", default=data_dir, help=data_dir_help)
+        sub.set_defaults(handler=handler)
+        return sub
+
+    sub = add("generate-initial", _generate_initial, "Generate the initial JSON files (100 records each)")
+    sub.add_argument("--serializer", default="auto", choices=SERIALIZER_CHOICES)
+    sub.add_argument("--seed", type=int, default=42)
+
+    sub = add("generate-updates", _generate_updates, "Generate timestamped update files (10 updates + 10 new each)")
+    sub.add_argument("--serializer", default="auto", choices=SERIALIZER_CHOICES)
+    sub.add_argument("--seed", type=int, default=300)
+    sub.add_argument("--scenario", default="clean", choices=SCENARIO_CHOICES,
+                     help="Preset rates of duplicate files, duplicate rows and stale late arrivals")
+    add_rates(sub)
+
+    add("validate", _validate, "Validate generated JSON files")
+
+    sub = add("upload", _upload, "Print PUT commands for the internal stages")
+    only = sub.add_mutually_exclusive_group()
+    only.add_argument("--initial-only", action="store_true", help="Only initial files (customers.json, ...)")
+    only.add_argument("--updates-only", action="store_true",
+                      help="Only update files (*_update_*.json, without *_late.json)")
+    only.add_argument("--late-only", action="store_true",
+                      help="Only stale late arrivals (*_late.json); run after the tasks merged the updates")
+    sub.add_argument("--output", help="Write the PUT commands to this file instead of stdout")
+
+    sub = add("compact", _compact, "Rewrite existing JSON files with a compact serializer")
+    sub.add_argument("--serializer", default="auto", choices=SERIALIZER_CHOICES)
+    sub.add_argument("--dry-run", action="store_true", help="Report savings without rewriting files")
+
+    sub = add("orchestrate", _orchestrate, "Run the full reset-and-reload cycle as a concurrent DAG. "
+              "Data is seeded per dataset, so it differs from generate-initial/generate-updates with the same seed.",
+              data_dir=None,
+              data_dir_help="Where to write generated files (default: a new orchestrate_runs/<timestamp>/)")
+    sub.add_argument("--serializer", default="auto", choices=SERIALIZER_CHOICES)
+    sub.add_argument("--connector", default="recording", choices=["recording", "snowflake"],
+                     help="recording = local no-op stand-in; snowflake needs SNOWFLAKE_* env vars")
+    sub.add_argument("--max-workers", type=_positive_int, default=10, help="Maximum steps running at once")
+    sub.add_argument("--latency-ms", type=float, default=0, help="Simulated per-statement latency (recording)")
+    sub.add_argument("--compare-serial", action="store_true", help="Also run with 1 worker and report the speedup")
+    sub.add_argument("--sql-dir", default=".", help="Directory holding the demo .sql scripts (repository root)")
+
+    sub = add("check-replay", _check_replay, "Replay batch sequences offline and check LATEST stays identical")
+    sub.add_argument("--scenario", action="append", choices=SCENARIO_CHOICES,
+                     help="Scenario to replay (repeatable; default: all)")
+    sub.add_argument("--updates", type=int, default=3, help="Update files per dataset after the initial file")
+    sub.add_argument("--seed", type=int, default=42)
+    sub.add_argument("--update-seed", type=int, default=300)
+    sub.add_argument("--from-files", action="store_true", help="Replay the files in --data-dir instead")
+    add_rates(sub)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args) or 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,51 @@
+"""
+Rewrite existing JSON files with a compact serializer.
+
+Files produced before the compact writers (e.g. the indent=2 files in
+sample_data/) carry whitespace Snowpipe has to scan on every load. Parsed
+content is unchanged; a file is only rewritten when the result is smaller.
+Files that do not parse are reported and left untouched.
+"""
+
+import json
+from pathlib import Path
+
+from snowpipe_demo.serializers import get_serializer
+
+
+def main(data_dir="sample_data", serializer="auto", dry_run=False):
+    files = sorted(Path(data_dir).glob("*.json"))
+    if not files:
+        print(f"❌ No JSON files found in {data_dir}/")
+        return 1
+
+    serializer = get_serializer(serializer)
+    before_total = after_total = 0
+    failed = 0
+    for filepath in files:
+        raw = filepath.read_bytes()
+        try:
+            compacted = serializer.dumps(json.loads(raw))
+        except ValueError as e:
+            failed += 1
+            print(f"❌ {filepath.name}: invalid JSON: {e}")
+            continue
+        before_total += len(raw)
+        if len(compacted) < len(raw):
+            after_total += len(compacted)
+            if not dry_run:
+                filepath.write_bytes(compacted)
+            print(f"🗜️  {filepath.name}: {len(raw):,} → {len(compacted):,} bytes")
+        else:
+            after_total += len(raw)
+            print(f"✅ {filepath.name}: already compact ({len(raw):,} bytes)")
+
+    saved = before_total - after_total
+    verb = "Would save" if dry_run else "Saved"
+    compacted_files = len(files) - failed
+    print(f"\n📉 {verb} {saved:,} bytes ({saved / max(before_total, 1):.0%}) across {compacted_files} files"
+          f" [{serializer.name}]")
+    if failed:
+        print(f"❌ {failed} files could not be parsed")
+        return 1
+    return 0
@@ -0,0 +1,81 @@
+"""
+Pluggable SQL connectors for running the demo from Python.
+
+1. RecordingConnector  - local no-op stand-in: records every statement (with
+                         the thread that sent it) and can simulate round-trip
+                         latency, so orchestration can be exercised offline
+2. SnowflakeConnector  - snowflake-connector-python (optional dependency),
+                         one session per worker thread
+
+Both expose execute(statement) and close().
+"""
+
+import os
+import threading
+import time
+
+
+class RecordingConnector:
+    name = "recording"
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.statements = []
+        self._lock = threading.Lock()
+
+    def execute(self, statement):
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.statements.append((threading.current_thread().name, statement))
+        return []
+
+    def close(self):
+        pass
+
+
+class SnowflakeConnector:
+    """Connection settings come from SNOWFLAKE_ACCOUNT / _USER / _PASSWORD / _ROLE / _WAREHOUSE."""
+
+    name = "snowflake"
+
+    def __init__(self, **params):
+        import snowflake.connector
+        self._connect = snowflake.connector.connect
+        self.params = params or {
+            key: os.environ[f"SNOWFLAKE_{key.upper()}"]
+            for key in ("account", "user", "password", "role", "warehouse")
+            if f"SNOWFLAKE_{key.upper()}" in os.environ
+        }
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        # Sessions carry USE SCHEMA state, so each worker thread gets its own
+        if not hasattr(self._local, "connection"):
+            self._local.connection = self._connect(**self.params)
+            with self._lock:
+                self._connections.append(self._local.connection)
+        return self._local.connection
+
+    def execute(self, statement):
+        with self._connection().cursor() as cursor:
+            cursor.execute(statement)
+            return cursor.fetchall()
+
+    def close(self):
+        for connection in self._connections:
+            connection.close()
+
+
+CONNECTORS = {
+    "recording": RecordingConnector,
+    "snowflake": SnowflakeConnector,
+}
+
+
+def get_connector(name="recording", **kwargs):
+    if name not in CONNECTORS:
+        raise ValueError(f"Unknown connector '{name}'. Choose from: {', '.join(CONNECTORS)}")
+    return CONNECTORS[name](**kwargs)
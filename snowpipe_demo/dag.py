@@ -0,0 +1,109 @@
+"""
+Minimal dependency-DAG runner with bounded parallelism.
+
+Steps are plain callables with a name and the names they depend on. Up to
+`max_workers` ready steps run at once on a thread pool; when more are ready,
+the ones heading the longest chain of dependents go first, so a serial
+setup chain is never stuck behind independent work. The run stops
+scheduling new work after the first failure. Timings are kept per step so
+the critical path can be reported afterwards.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class Step:
+    def __init__(self, name, func, deps=()):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.start = None
+        self.end = None
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+
+def _check(steps):
+    names = {step.name for step in steps}
+    if len(names) != len(steps):
+        raise ValueError("Duplicate step names in DAG")
+    for step in steps:
+        missing = set(step.deps) - names
+        if missing:
+            raise ValueError(f"Step '{step.name}' depends on unknown steps: {', '.join(sorted(missing))}")
+
+
+def _chain_lengths(steps):
+    """Number of steps on the longest chain starting at each step."""
+    dependents = {step.name: [] for step in steps}
+    for step in steps:
+        for dep in step.deps:
+            dependents[dep].append(step.name)
+    lengths = {}
+    visiting = set()
+
+    def length(name):
+        if name not in lengths:
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through step '{name}'")
+            visiting.add(name)
+            lengths[name] = 1 + max((length(d) for d in dependents[name]), default=0)
+            visiting.discard(name)
+        return lengths[name]
+
+    for step in steps:
+        length(step.name)
+    return lengths
+
+
+def run_dag(steps, max_workers=4):
+    """Run every step once its dependencies are done; returns total wall time."""
+    _check(steps)
+    priority = _chain_lengths(steps)
+    pending = {step.name: step for step in steps}
+    done = set()
+    running = {}
+    started = time.perf_counter()
+
+    def timed(step):
+        step.start = time.perf_counter() - started
+        try:
+            return step.func()
+        finally:
+            step.end = time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dag") as pool:
+        while pending or running:
+            ready = [step for step in pending.values() if all(dep in done for dep in step.deps)]
+            ready.sort(key=lambda step: -priority[step.name])
+            for step in ready[:max_workers - len(running)]:
+                running[pool.submit(timed, step)] = step
+                del pending[step.name]
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                step = running.pop(future)
+                error = future.exception()
+                if error is not None:
+                    wait(running)
+                    raise RuntimeError(f"Step '{step.name}' failed: {error}") from error
+                done.add(step.name)
+
+    return time.perf_counter() - started
+
+
+def critical_path(steps):
+    """
+    Chain of steps that actually gated the run, first step first: start from
+    the step that finished last and follow whichever dependency finished last.
+    """
+    by_name = {step.name: step for step in steps}
+    step = max(steps, key=lambda s: s.end)
+    path = [step]
+    while step.deps:
+        step = max((by_name[dep] for dep in step.deps), key=lambda s: s.end)
+        path.append(step)
+    return path[::-1]
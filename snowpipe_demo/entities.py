@@ -0,0 +1,50 @@
+"""
+The ten demo entities and the Snowflake objects each one flows through.
+
+Dataset names match the JSON file prefixes in sample_data/ (customers.json,
+customers_update_<timestamp>.json, ...).
+"""
+
+# Dataset name → primary key column written by the generators
+ENTITIES = {
+    "customers": "CUSTOMER_ID",
+    "products": "PRODUCT_ID",
+    "orders": "ORDER_ID",
+    "order_items": "ORDER_ITEM_ID",
+    "suppliers": "SUPPLIER_ID",
+    "inventory": "INVENTORY_ID",
+    "warehouses": "WAREHOUSE_ID",
+    "employees": "EMPLOYEE_ID",
+    "sales_territories": "TERRITORY_ID",
+    "promotions": "PROMOTION_ID",
+}
+
+DATABASE = "SNOWPIPE_DT_DEMO"
+
+
+def dataset_of(filepath):
+    """customers_update_20250910_155129.json → customers"""
+    return filepath.stem.split("_update_")[0]
+
+
+def is_update_file(filepath):
+    return "_update_" in filepath.stem
+
+
+def is_late_file(filepath):
+    """Stale late arrivals written by generate-updates --scenario (…_update_<ts>_late.json)."""
+    return is_update_file(filepath) and filepath.stem.endswith("_late")
+
+
+def stage_name(dataset):
+    """Internal stage the dataset's files are PUT to (see 03_create_stages.sql)."""
+    return f"{DATABASE}.DEMO_STAGES.STG_{dataset.upper()}_FILES"
+
+
+# Streams, tasks and LATEST_* tables use a shorter name for one dataset
+_OBJECT_NAMES = {"sales_territories": "TERRITORIES"}
+
+
+def object_name(dataset):
+    """Name used in STG_<X>_STREAM / PROCESS_<X>_STREAM / LATEST_<X>."""
+    return _OBJECT_NAMES.get(dataset, dataset.upper())
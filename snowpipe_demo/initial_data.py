@@ -0,0 +1,287 @@
+"""
+Initial Data Generator for Snowpipe + Streams + Tasks Demo
+
+Generates JSON files with 100 unique records each to demonstrate:
+1. Snowpipe with JSON schema detection loading initial records
+2. Streams capturing changes when update files are loaded
+3. Tasks processing changes with intelligent MERGE operations
+
+Creates 10 JSON files, each with 100 unique records (1000 total records).
+Run with: snowpipe-demo generate-initial
+"""
+
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from faker import Faker
+
+from snowpipe_demo.serializers import get_serializer, write_records
+
+# =============================================================================
+# 1. CUSTOMERS (100 unique customers)
+# =============================================================================
+def generate_customers(fake, rng):
+    customers = []
+    for i in range(1, 101):  # 100 unique customers
+        customer = {
+            "CUSTOMER_ID": i,
+            "CUSTOMER_NAME": fake.name(),
+            "EMAIL": fake.email(),
+            "PHONE": fake.phone_number(),
+            "ADDRESS": fake.street_address(),
+            "CITY": fake.city(),
+            "STATE": fake.state_abbr(),
+            "ZIP_CODE": fake.zipcode(),
+            "COUNTRY": "USA",
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(days=rng.randint(1, 30)),
+            "DATA_VERSION": 1,  # Initial version
+            "RECORD_STATUS": "ACTIVE"
+        }
+        customers.append(customer)
+    return customers
+
+# =============================================================================
+# 2. PRODUCTS (100 unique products)
+# =============================================================================
+def generate_products(fake, rng):
+    products = []
+    categories = ["Electronics", "Clothing", "Home & Garden", "Books", "Sports", "Beauty", "Automotive", "Food", "Toys", "Health"]
+    
+    for i in range(1, 101):  # 100 unique products
+        product = {
+            "PRODUCT_ID": i,
+            "PRODUCT_NAME": fake.catch_phrase().replace(",", ""),
+            "CATEGORY": rng.choice(categories),
+            "PRICE": round(rng.uniform(9.99, 999.99), 2),
+            "SUPPLIER_ID": rng.randint(1, 25),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(days=rng.randint(1, 30)),
+            "DATA_VERSION": 1,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        products.append(product)
+    return products
+
+# =============================================================================
+# 3. ORDERS (100 unique orders)
+# =============================================================================
+def generate_orders(fake, rng):
+    orders = []
+    statuses = ["PENDING", "PROCESSING", "SHIPPED", "DELIVERED", "CANCELLED"]
+    
+    for i in range(1, 101):  # 100 unique orders
+        order = {
+            "ORDER_ID": i,
+            "CUSTOMER_ID": rng.randint(1, 100),
+            "ORDER_DATE": (datetime.now() - timedelta(days=rng.randint(1, 60))).strftime('%Y-%m-%d'),
+            "TOTAL_AMOUNT": round(rng.uniform(25.00, 1500.00), 2),
+            "ORDER_STATUS": rng.choice(statuses),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(days=rng.randint(1, 30)),
+            "DATA_VERSION": 1,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        orders.append(order)
+    return orders
+
+# =============================================================================
+# 4. ORDER ITEMS (100 unique order items)
+# =============================================================================
+def generate_order_items(fake, rng):
+    order_items = []
+    
+    for i in range(1, 101):  # 100 unique order items
+        order_item = {
+            "ORDER_ITEM_ID": i,
+            "ORDER_ID": rng.randint(1, 100),
+            "PRODUCT_ID": rng.randint(1, 100),
+            "QUANTITY": rng.randint(1, 10),
+            "UNIT_PRICE": round(rng.uniform(9.99, 299.99), 2),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(days=rng.randint(1, 30)),
+            "DATA_VERSION": 1,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        order_items.append(order_item)
+    return order_items
+
+# =============================================================================
+# 5. SUPPLIERS (100 unique suppliers)
+# =============================================================================
+def generate_suppliers(fake, rng):
+    suppliers = []
+    
+    for i in range(1, 101):  # 100 unique suppliers
+        supplier = {
+            "SUPPLIER_ID": i,
+            "SUPPLIER_NAME": fake.company(),
+            "CONTACT_EMAIL": fake.company_email(),
+            "CONTACT_PHONE": fake.phone_number(),
+            "ADDRESS": fake.address().replace('\n', ', '),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(days=rng.randint(1, 30)),
+            "DATA_VERSION": 1,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        suppliers.append(supplier)
+    return suppliers
+
+# =============================================================================
+# 6. INVENTORY (100 unique inventory records)
+# =============================================================================
+def generate_inventory(fake, rng):
+    inventory = []
+    
+    for i in range(1, 101):  # 100 unique inventory records
+        inventory_record = {
+            "INVENTORY_ID": i,
+            "PRODUCT_ID": rng.randint(1, 100),
+            "WAREHOUSE_ID": rng.randint(1, 20),
+            "QUANTITY_ON_HAND": rng.randint(0, 1000),
+            "REORDER_LEVEL": rng.randint(10, 50),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(days=rng.randint(1, 30)),
+            "DATA_VERSION": 1,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        inventory.append(inventory_record)
+    return inventory
+
+# =============================================================================
+# 7. WAREHOUSES (100 unique warehouses)
+# =============================================================================
+def generate_warehouses(fake, rng):
+    warehouses = []
+    
+    for i in range(1, 101):  # 100 unique warehouses
+        warehouse = {
+            "WAREHOUSE_ID": i,
+            "WAREHOUSE_NAME": f"Warehouse {fake.city()} {i}",
+            "LOCATION": f"{fake.city()}, {fake.state_abbr()}",
+            "MANAGER_ID": rng.randint(1, 100),
+            "CAPACITY": rng.randint(10000, 100000),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(days=rng.randint(1, 30)),
+            "DATA_VERSION": 1,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        warehouses.append(warehouse)
+    return warehouses
+
+# =============================================================================
+# 8. EMPLOYEES (100 unique employees)
+# =============================================================================
+def generate_employees(fake, rng):
+    employees = []
+    departments = ["Sales", "Marketing", "Engineering", "HR", "Finance", "Operations", "Customer Service", "IT", "Legal", "Executive"]
+    
+    for i in range(1, 101):  # 100 unique employees
+        employee = {
+            "EMPLOYEE_ID": i,
+            "FIRST_NAME": fake.first_name(),
+            "LAST_NAME": fake.last_name(),
+            "EMAIL": fake.email(),
+            "PHONE": fake.phone_number(),
+            "DEPARTMENT": rng.choice(departments),
+            "SALARY": round(rng.uniform(35000, 150000), 2),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(days=rng.randint(1, 30)),
+            "DATA_VERSION": 1,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        employees.append(employee)
+    return employees
+
+# =============================================================================
+# 9. TERRITORIES (100 unique territories)
+# =============================================================================
+def generate_territories(fake, rng):
+    territories = []
+    regions = ["North", "South", "East", "West", "Central", "Northeast", "Southeast", "Northwest", "Southwest", "Pacific"]
+    
+    for i in range(1, 101):  # 100 unique territories
+        territory = {
+            "TERRITORY_ID": i,
+            "TERRITORY_NAME": f"{fake.state()} {rng.choice(['North', 'South', 'Metro', 'Valley'])}",
+            "REGION": rng.choice(regions),
+            "MANAGER_ID": rng.randint(1, 100),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(days=rng.randint(1, 30)),
+            "DATA_VERSION": 1,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        territories.append(territory)
+    return territories
+
+# =============================================================================
+# 10. PROMOTIONS (100 unique promotions)
+# =============================================================================
+def generate_promotions(fake, rng):
+    promotions = []
+    promo_types = ["PERCENTAGE", "FIXED_AMOUNT", "BUY_ONE_GET_ONE", "FREE_SHIPPING", "LOYALTY_BONUS"]
+    
+    for i in range(1, 101):  # 100 unique promotions
+        promotion = {
+            "PROMOTION_ID": i,
+            "PROMOTION_NAME": f"{fake.catch_phrase().replace(',', '')} Sale",
+            "DISCOUNT_PERCENTAGE": round(rng.uniform(5.0, 50.0), 2) if rng.choice([True, False]) else None,
+            "START_DATE": (datetime.now() - timedelta(days=rng.randint(30, 90))).strftime('%Y-%m-%d'),
+            "END_DATE": (datetime.now() + timedelta(days=rng.randint(30, 180))).strftime('%Y-%m-%d'),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(days=rng.randint(1, 30)),
+            "DATA_VERSION": 1,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        promotions.append(promotion)
+    return promotions
+
+# =============================================================================
+# GENERATE AND SAVE ALL FILES
+# =============================================================================
+GENERATORS = {
+    "customers": generate_customers,
+    "products": generate_products,
+    "orders": generate_orders,
+    "order_items": generate_order_items,
+    "suppliers": generate_suppliers,
+    "inventory": generate_inventory,
+    "warehouses": generate_warehouses,
+    "employees": generate_employees,
+    "sales_territories": generate_territories,
+    "promotions": generate_promotions
+}
+
+
+def generate_datasets(seed=42):
+    """Build every initial dataset in memory: {dataset name: records}."""
+    fake = Faker()
+    fake.seed_instance(seed)  # For reproducible data
+    rng = random.Random(seed)
+    return {dataset_name: generator(fake, rng) for dataset_name, generator in GENERATORS.items()}
+
+
+def generate_dataset(dataset_name, seed=42):
+    """Build one initial dataset with its own Faker/RNG, safe to run concurrently."""
+    fake = Faker()
+    fake.seed_instance(f"{seed}:{dataset_name}")
+    return GENERATORS[dataset_name](fake, random.Random(f"{seed}:{dataset_name}"))
+
+
+def main(output_dir="sample_data", serializer="auto", seed=42):
+    data_dir = Path(output_dir)
+    data_dir.mkdir(exist_ok=True)
+
+    # Compact JSON writer (orjson when installed); RECORD_TIMESTAMP stays a datetime
+    serializer = get_serializer(serializer)
+
+    print("🚀 Generating initial JSON data files (100 records each)...")
+    datasets = generate_datasets(seed)
+
+    # Save all datasets to JSON files
+    for dataset_name, data in datasets.items():
+        filename = f"{dataset_name}.json"
+        filepath = data_dir / filename
+        size = write_records(filepath, data, serializer)
+        print(f"✅ Created {filename}: {len(data)} records ({size:,} bytes)")
+
+    print(f"\n🎉 Initial data generation complete!")
+    print(f"📁 Location: {data_dir.absolute()}")
+    print(f"📊 Total files: {len(datasets)}")
+    print(f"🧾 Serializer: {serializer.name}")
+    print(f"📈 Total records: {sum(len(data) for data in datasets.values())}")
+    print("\n📝 Next steps:")
+    print("1. Upload files: snowpipe-demo upload --initial-only (or @06_demo_file_upload.sql)")
+    print("2. Generate updates: snowpipe-demo generate-updates")
+    print("3. Upload updates: snowpipe-demo upload --updates-only (or @06B_upload_update_files.sql)")
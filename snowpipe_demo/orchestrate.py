@@ -0,0 +1,180 @@
+"""
+Concurrent end-to-end demo runner (reset-and-reload cycle).
+
+08_master_demo_script.sql and the README run every step in sequence, but
+most of the work is independent across the ten datasets. This module models
+the cycle as a DAG and runs per-dataset branches concurrently with bounded
+parallelism:
+
+  reset → 01 setup database ─┬→ task warehouse ──────────────────────┐
+                             └→ setup:<dataset>  (02/03/04 statements) │
+  generate:<dataset> → validate:<dataset> → put:<dataset> ──→ stream_task:<dataset>
+  generate_updates:<dataset> → validate_updates:<dataset> ──→ put_updates:<dataset>
+                                                                  → monitor (07)
+
+put steps PUT the file and then REFRESH the dataset's pipe, as
+06_demo_file_upload.sql does (AUTO_INGEST does not fire for internal
+stages). stream_task creates the LATEST_* table the task MERGEs into.
+
+Statements of 02/03/04/07 that concern exactly one dataset go to that
+dataset's branch (see sql.partition_statements); the rest run once. SQL goes
+through a pluggable connector (connectors.py); the default "recording"
+connector only records statements, optionally with a simulated latency.
+The .sql scripts are read from --sql-dir (the current directory by default).
+
+Generated files go to a run-specific directory (orchestrate_runs/<timestamp>/
+unless --data-dir is given), never over sample_data/. Each dataset is
+generated with its own Faker/RNG seeded "<seed>:<dataset>" so branches can
+run concurrently; the data therefore differs from generate-initial /
+generate-updates with the same seed. The --compare-serial run writes to a
+temporary directory that is removed afterwards.
+"""
+
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from snowpipe_demo import initial_data, update_data
+from snowpipe_demo.connectors import get_connector
+from snowpipe_demo.dag import Step, critical_path, run_dag
+from snowpipe_demo.entities import DATABASE, ENTITIES
+from snowpipe_demo.serializers import get_serializer, write_records
+from snowpipe_demo.sql import (SQL_DIR, load_statements, partition_statements, pipe_refresh_statement,
+                               stream_task_statements)
+from snowpipe_demo.upload import put_statement
+
+RUNS_DIR = "orchestrate_runs"
+from snowpipe_demo.validate import validate_file
+
+SETUP_SCRIPTS = ["02_create_stage_tables.sql", "03_create_stages.sql", "04_create_snowpipes.sql"]
+MONITOR_SCRIPT = "07_demo_monitoring_validation.sql"
+
+
+# =============================================================================
+# STEP FACTORIES
+# =============================================================================
+def _run_sql(connector, statements):
+    def run():
+        for statement in statements:
+            connector.execute(statement)
+    return run
+
+
+def _generate(dataset, filepath, generator, seed, serializer):
+    def run():
+        write_records(filepath, generator(dataset, seed), serializer)
+    return run
+
+
+def _validate(filepath):
+    def run():
+        _, errors, _ = validate_file(filepath)
+        if errors:
+            raise ValueError(f"{filepath.name}: {errors[0]}")
+    return run
+
+
+def build_cycle(connector, data_dir="sample_data", serializer="auto", seed=42, update_seed=300, sql_dir=SQL_DIR):
+    """Steps for one full reset-and-reload cycle."""
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    serializer = get_serializer(serializer)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    steps = [
+        Step("reset", _run_sql(connector, [f"DROP DATABASE IF EXISTS {DATABASE}"])),
+        Step("setup_database", _run_sql(connector, load_statements("01_setup_database.sql", sql_dir)), ["reset"]),
+    ]
+
+    warehouse = [s for s in load_statements("05_create_streams_and_tasks.sql", sql_dir)
+                 if s.startswith("CREATE WAREHOUSE")]
+    steps.append(Step("task_warehouse", _run_sql(connector, warehouse), ["setup_database"]))
+
+    setup_shared, setup = [], {dataset: [] for dataset in ENTITIES}
+    for script in SETUP_SCRIPTS:
+        shared, per_dataset = partition_statements(script, sql_dir)
+        setup_shared += shared
+        for dataset, statements in per_dataset.items():
+            setup[dataset] += statements
+    monitor_shared, monitor = partition_statements(MONITOR_SCRIPT, sql_dir)
+
+    for dataset in ENTITIES:
+        initial_file = data_dir / f"{dataset}.json"
+        update_file = data_dir / f"{dataset}_update_{timestamp}.json"
+        refresh = pipe_refresh_statement(dataset, sql_dir)
+        steps += [
+            Step(f"setup:{dataset}", _run_sql(connector, setup[dataset]), ["setup_database"]),
+            Step(f"generate:{dataset}",
+                 _generate(dataset, initial_file, initial_data.generate_dataset, seed, serializer)),
+            Step(f"validate:{dataset}", _validate(initial_file), [f"generate:{dataset}"]),
+            Step(f"put:{dataset}", _run_sql(connector, [put_statement(initial_file).rstrip(";"), refresh]),
+                 [f"validate:{dataset}", f"setup:{dataset}"]),
+            Step(f"stream_task:{dataset}", _run_sql(connector, stream_task_statements(dataset, sql_dir)),
+                 [f"put:{dataset}", "task_warehouse"]),
+            Step(f"generate_updates:{dataset}",
+                 _generate(dataset, update_file, update_data.generate_dataset_updates, update_seed, serializer)),
+            Step(f"validate_updates:{dataset}", _validate(update_file), [f"generate_updates:{dataset}"]),
+            Step(f"put_updates:{dataset}", _run_sql(connector, [put_statement(update_file).rstrip(";"), refresh]),
+                 [f"validate_updates:{dataset}", f"stream_task:{dataset}"]),
+        ]
+        if dataset in monitor:
+            steps.append(Step(f"monitor:{dataset}", _run_sql(connector, monitor[dataset]),
+                              [f"put_updates:{dataset}"]))
+
+    # Statements touching several (or no) datasets: SHOW/status checks, cross-table summaries
+    steps.append(Step("setup_checks", _run_sql(connector, setup_shared),
+                      [f"setup:{dataset}" for dataset in ENTITIES]))
+    steps.append(Step("monitor", _run_sql(connector, monitor_shared),
+                      ["setup_checks"] + [f"put_updates:{dataset}" for dataset in ENTITIES]))
+    return steps
+
+
+# =============================================================================
+# REPORTING
+# =============================================================================
+def report(steps, wall):
+    busy = sum(step.duration for step in steps)
+    path = critical_path(steps)
+
+    print(f"\n{'STEP':<32}{'START s':>9}{'SECONDS':>9}")
+    for step in sorted(steps, key=lambda s: s.start):
+        marker = "  ◀ critical" if step in path else ""
+        print(f"{step.name:<32}{step.start:>9.3f}{step.duration:>9.3f}{marker}")
+
+    print(f"\n🧭 CRITICAL PATH ({sum(step.duration for step in path):.3f}s):")
+    print("   " + " → ".join(f"{step.name} ({step.duration:.3f}s)" for step in path))
+    print(f"\n⏱️  Wall clock: {wall:.3f}s | step time: {busy:.3f}s | parallelism: {busy / wall:.1f}x")
+
+
+def run_cycle(connector_name, data_dir, serializer, max_workers, latency, sql_dir=SQL_DIR):
+    options = {"latency": latency} if connector_name == "recording" else {}
+    connector = get_connector(connector_name, **options)
+    try:
+        steps = build_cycle(connector, data_dir, serializer, sql_dir=sql_dir)
+        wall = run_dag(steps, max_workers)
+    finally:
+        connector.close()
+    return steps, wall
+
+
+def main(data_dir=None, serializer="auto", connector="recording", max_workers=len(ENTITIES),
+         latency_ms=0.0, compare_serial=False, sql_dir=SQL_DIR):
+    latency = latency_ms / 1000
+    data_dir = Path(data_dir or Path(RUNS_DIR) / datetime.now().strftime("%Y%m%d_%H%M%S"))
+    if not (Path(sql_dir) / "01_setup_database.sql").exists():
+        print(f"❌ Demo .sql scripts not found in {Path(sql_dir).absolute()}"
+              " - run from the repository root or pass --sql-dir")
+        return 1
+    print(f"🚀 Reset-and-reload cycle: {len(ENTITIES)} datasets, {max_workers} workers, connector={connector}"
+          + (f" ({latency_ms:.0f} ms simulated latency)" if connector == "recording" and latency_ms else ""))
+    print(f"📁 Generated files: {data_dir.absolute()}")
+
+    steps, wall = run_cycle(connector, data_dir, serializer, max_workers, latency, sql_dir)
+    report(steps, wall)
+
+    if compare_serial:
+        # Same work again, but its files go to a scratch directory so the run's data_dir stays one cycle
+        with tempfile.TemporaryDirectory() as scratch:
+            _, serial_wall = run_cycle(connector, scratch, serializer, 1, latency, sql_dir)
+        print(f"🐢 Same cycle with 1 worker: {serial_wall:.3f}s → {serial_wall / wall:.1f}x faster concurrently")
+    return 0
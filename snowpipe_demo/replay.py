@@ -0,0 +1,200 @@
+"""
+Offline replay checker for the stream → MERGE → LATEST pipeline.
+
+Applies the MERGE from fix_merge_operations.sql in plain Python, one file
+per task run:
+  1. ROW_NUMBER() per key ORDER BY DATA_VERSION DESC, RECORD_TIMESTAMP DESC → keep row 1
+  2. WHEN MATCHED AND target.DATA_VERSION < source.DATA_VERSION → UPDATE
+  3. WHEN NOT MATCHED → INSERT
+
+For every delivery scenario (scenarios.py) it builds the initial file plus
+--updates update files per dataset, then checks that:
+- replaying the whole sequence a second time on top of the result (full
+  redelivery) leaves LATEST unchanged, and
+- LATEST is identical to the one built from the clean, fault-free files.
+
+Late arrivals are delivered in the file after their source row (or a final
+_late file), so they reach the MERGE's version guard instead of being
+dropped by the in-batch dedupe.
+
+It also counts the redundant rows each scenario pushed through the stream:
+rows the MERGE read without changing LATEST, split into rows dropped by the
+ROW_NUMBER dedupe, rows rejected because LATEST already holds a higher
+DATA_VERSION (stale), and rows matched at the same DATA_VERSION (no-op).
+
+With --from-files the files already in --data-dir are replayed instead
+(initial file first, then update files in name order); only the second-pass
+check applies there, since there is no clean reference.
+"""
+
+import json
+import random
+from pathlib import Path
+
+from snowpipe_demo.entities import ENTITIES, dataset_of, is_update_file
+from snowpipe_demo.scenarios import SCENARIOS, get_scenario, inject_rows, redeliver
+
+COUNTERS = ("rows", "deduped", "stale", "no_op", "applied")
+
+
+# =============================================================================
+# MERGE EMULATION
+# =============================================================================
+def merge_batch(latest, rows, key):
+    """Apply one task run's stream rows to `latest` (key → record); returns counters."""
+    newest = {}
+    for row in rows:
+        current = newest.get(row[key])
+        if current is None or (row["DATA_VERSION"], row["RECORD_TIMESTAMP"]) > \
+                (current["DATA_VERSION"], current["RECORD_TIMESTAMP"]):
+            newest[row[key]] = row
+
+    applied = stale = 0
+    for key_value, row in newest.items():
+        target = latest.get(key_value)
+        if target is None or target["DATA_VERSION"] < row["DATA_VERSION"]:
+            latest[key_value] = row
+            applied += 1
+        elif target["DATA_VERSION"] > row["DATA_VERSION"]:
+            stale += 1
+    return {"rows": len(rows), "deduped": len(rows) - len(newest), "stale": stale,
+            "no_op": len(newest) - applied - stale, "applied": applied}
+
+
+def replay(batches, key, latest=None):
+    """Merge (filename, rows) batches in order; returns (latest, summed counters)."""
+    latest = {} if latest is None else latest
+    totals = dict.fromkeys(COUNTERS, 0)
+    for _, rows in batches:
+        for counter, value in merge_batch(latest, rows, key).items():
+            totals[counter] += value
+    return latest, totals
+
+
+def check(batches, key, clean_batches=None):
+    """Replay, replay again on top, and compare against the clean sequence when given."""
+    latest, totals = replay(batches, key)
+    replayed, _ = replay(batches, key, dict(latest))
+    result = {"files": len(batches), **totals, "idempotent": replayed == latest}
+    if clean_batches is not None:
+        clean, clean_totals = replay(clean_batches, key)
+        result["matches_clean"] = latest == clean
+        result["extra_rows"] = totals["rows"] - clean_totals["rows"]
+    return result
+
+
+# =============================================================================
+# BATCH SEQUENCES
+# =============================================================================
+def clean_sequence(dataset, updates=3, seed=42, update_seed=300):
+    """Initial file plus `updates` update files, each from its own seed."""
+    from snowpipe_demo.initial_data import generate_dataset
+    from snowpipe_demo.update_data import generate_dataset_updates
+
+    batches = [(f"{dataset}.json", generate_dataset(dataset, seed))]
+    for i in range(updates):
+        batches.append((f"{dataset}_update_{i + 1}.json", generate_dataset_updates(dataset, update_seed + i)))
+    return batches
+
+
+def scenario_sequence(clean_batches, rates, rng):
+    """
+    Deliver the clean update files with injected rows and redelivered files.
+    Stale copies ride along in the next update file; those of the last file
+    follow in a separate _late file.
+    """
+    batches = clean_batches[:1]
+    pending = []
+    for filename, rows in clean_batches[1:]:
+        delivered, late = inject_rows(rows, rates, rng)
+        delivered = pending + delivered
+        batches.append((filename, delivered))
+        if redeliver(rates, rng):
+            batches.append((filename.replace(".json", "_redelivered.json"), delivered))
+        pending = late
+    if pending:
+        batches.append((clean_batches[-1][0].replace(".json", "_late.json"), pending))
+    return batches
+
+
+def file_sequences(data_dir):
+    """{dataset: [(filename, rows), ...]} from the JSON files in data_dir."""
+    sequences = {}
+    for dataset in ENTITIES:
+        files = [data_dir / f"{dataset}.json"] if (data_dir / f"{dataset}.json").exists() else []
+        files += sorted(f for f in data_dir.glob(f"{dataset}_update_*.json")
+                        if is_update_file(f) and dataset_of(f) == dataset)
+        if files:
+            sequences[dataset] = [(f.name, json.loads(f.read_text())) for f in files]
+    return sequences
+
+
+# =============================================================================
+# REPORTING
+# =============================================================================
+def _summarize(results):
+    summary = dict.fromkeys(("files", *COUNTERS, "extra_rows"), 0)
+    for result in results.values():
+        for counter in summary:
+            summary[counter] += result.get(counter, 0)
+    summary["idempotent"] = all(result["idempotent"] for result in results.values())
+    # None = no clean reference (--from-files): EXTRA and CLEAN are shown as "-"
+    compared = all("matches_clean" in result for result in results.values())
+    summary["matches_clean"] = all(r["matches_clean"] for r in results.values()) if compared else None
+    if not compared:
+        summary["extra_rows"] = None
+    return summary
+
+
+def _print_table(rows):
+    print(f"\n{'SCENARIO':<16}{'FILES':>7}{'ROWS':>8}{'APPLIED':>9}{'DEDUPED':>9}{'STALE':>7}{'NO-OP':>7}"
+          f"{'REDUNDANT':>11}{'EXTRA':>7}  REPLAY  CLEAN")
+    for name, summary in rows:
+        redundant = summary["rows"] - summary["applied"]
+        clean = {None: "-", True: "✅", False: "❌"}[summary["matches_clean"]]
+        extra = "-" if summary["extra_rows"] is None else summary["extra_rows"]
+        print(f"{name:<16}{summary['files']:>7}{summary['rows']:>8}{summary['applied']:>9}"
+              f"{summary['deduped']:>9}{summary['stale']:>7}{summary['no_op']:>7}{redundant:>11}{extra:>7}"
+              f"  {'✅' if summary['idempotent'] else '❌':<6}  {clean}")
+
+
+def main(data_dir="sample_data", scenarios=None, updates=3, seed=42, update_seed=300, from_files=False,
+         duplicate_file_rate=None, duplicate_row_rate=None, late_arrival_rate=None):
+    overrides = {"duplicate_file_rate": duplicate_file_rate, "duplicate_row_rate": duplicate_row_rate,
+                 "late_arrival_rate": late_arrival_rate}
+    if from_files:
+        data_dir = Path(data_dir)
+        sequences = file_sequences(data_dir)
+        if not sequences:
+            print(f"❌ No JSON files found in {data_dir}")
+            return 1
+        print(f"🔁 Replaying files from {data_dir.absolute()} ({len(sequences)} datasets)")
+        results = {dataset: check(batches, ENTITIES[dataset]) for dataset, batches in sequences.items()}
+        table = [("files", _summarize(results))]
+    else:
+        scenarios = scenarios or list(SCENARIOS)
+        print(f"🔁 Replaying {len(scenarios)} scenarios: {len(ENTITIES)} datasets × "
+              f"(1 initial + {updates} update files)")
+        clean = {dataset: clean_sequence(dataset, updates, seed, update_seed) for dataset in ENTITIES}
+        table = []
+        for name in scenarios:
+            rates = get_scenario(name, **overrides)
+            results = {}
+            for dataset, clean_batches in clean.items():
+                rng = random.Random(f"{update_seed}:scenario:{name}:{dataset}")
+                batches = scenario_sequence(clean_batches, rates, rng)
+                results[dataset] = check(batches, ENTITIES[dataset], clean_batches)
+            table.append((name, _summarize(results)))
+
+    _print_table(table)
+    print("\nROWS = stream rows read by MERGE | REDUNDANT = ROWS - APPLIED (DEDUPED + STALE + NO-OP)"
+          " | EXTRA = ROWS beyond the clean run")
+    print("REPLAY = second full replay leaves LATEST unchanged | CLEAN = LATEST equals the fault-free run")
+
+    failed = [name for name, summary in table
+              if not summary["idempotent"] or summary["matches_clean"] is False]
+    if failed:
+        print(f"\n❌ LATEST state diverged for: {', '.join(failed)}")
+        return 1
+    print("\n🎉 LATEST state identical across replays for every scenario")
+    return 0
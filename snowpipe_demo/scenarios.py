@@ -0,0 +1,63 @@
+"""
+Delivery scenarios for update files: redelivered files, duplicate rows and
+stale-version late arrivals.
+
+Snowpipe can deliver the same file twice, and upstream can emit a lower
+DATA_VERSION after a higher one. The clean generators never do either, so
+these rates let generate-updates inject them on purpose:
+
+- duplicate_file_rate  chance an update file is written a second time (new name, same rows)
+- duplicate_row_rate   chance each record is repeated verbatim in the same file
+- late_arrival_rate    chance an updated record (DATA_VERSION > 1) gets a stale copy with
+                       a LOWER DATA_VERSION but a LATER RECORD_TIMESTAMP, delivered in a
+                       later file than the record itself
+
+Late copies are returned separately from the file's own rows. In the same
+file they would just be dropped by the MERGE's ROW_NUMBER dedupe. Only in a
+later file do they reach the target.DATA_VERSION < source.DATA_VERSION guard.
+Injection uses its own RNG, so the underlying clean records do not change.
+"""
+
+from datetime import timedelta
+
+SCENARIOS = {
+    "clean": {"duplicate_file_rate": 0.0, "duplicate_row_rate": 0.0, "late_arrival_rate": 0.0},
+    "redelivery": {"duplicate_file_rate": 0.3, "duplicate_row_rate": 0.0, "late_arrival_rate": 0.0},
+    "duplicate_rows": {"duplicate_file_rate": 0.0, "duplicate_row_rate": 0.2, "late_arrival_rate": 0.0},
+    "late_arrivals": {"duplicate_file_rate": 0.0, "duplicate_row_rate": 0.0, "late_arrival_rate": 0.3},
+    "chaos": {"duplicate_file_rate": 0.3, "duplicate_row_rate": 0.2, "late_arrival_rate": 0.3},
+}
+
+
+def get_scenario(name="clean", **overrides):
+    """Preset rates by name, with any non-None override applied on top."""
+    if name not in SCENARIOS:
+        raise ValueError(f"Unknown scenario '{name}'. Choose from: {', '.join(SCENARIOS)}")
+    rates = dict(SCENARIOS[name])
+    rates.update({key: value for key, value in overrides.items() if value is not None})
+    for key, value in rates.items():
+        if not 0.0 <= value <= 1.0:
+            raise ValueError(f"{key} must be between 0 and 1, got {value}")
+    return rates
+
+
+def inject_rows(records, rates, rng):
+    """Return (records plus duplicate rows, stale copies for a later file)."""
+    delivered = []
+    late = []
+    for record in records:
+        delivered.append(record)
+        if rng.random() < rates["duplicate_row_rate"]:
+            delivered.append(dict(record))
+        if record["DATA_VERSION"] > 1 and rng.random() < rates["late_arrival_rate"]:
+            late.append(dict(
+                record,
+                DATA_VERSION=rng.randint(1, record["DATA_VERSION"] - 1),
+                RECORD_TIMESTAMP=record["RECORD_TIMESTAMP"] + timedelta(minutes=rng.randint(1, 30)),
+            ))
+    return delivered, late
+
+
+def redeliver(rates, rng):
+    """Whether this file should be delivered a second time."""
+    return rng.random() < rates["duplicate_file_rate"]
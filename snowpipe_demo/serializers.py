@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Record Serializers for Snowpipe + Streams + Tasks Demo
+
+Both data generators write a JSON array of records per entity, which Snowpipe
+loads with STRIP_OUTER_ARRAY = TRUE. This module decides HOW those arrays are
+written to disk:
+
+1. "pretty"  - legacy json.dump(..., indent=2) output, kept for comparison
+2. "compact" - stdlib json, no indentation, no spaces after separators
+3. "orjson"  - orjson backend (optional dependency, used when installed)
+
+Every backend writes bytes straight to a buffered binary file and serializes
+datetime/date values natively, so generators can put datetime objects in the
+records instead of calling .isoformat() on every field.
+"""
+
+import json
+from datetime import date, datetime
+
+# =============================================================================
+# DATETIME HANDLING
+# =============================================================================
+def _default(value):
+    """json `default` hook: emit datetime/date the same way .isoformat() does."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+class StdlibSerializer:
+    """
+    stdlib json backend. Compact by default; indent=2 reproduces the old
+    json.dump(indent=2) files byte for byte (ASCII escapes included).
+    """
+
+    def __init__(self, indent=None):
+        self.indent = indent
+        self.name = "pretty" if indent else "compact"
+        # indent=None keeps the C encoder; separators drop the padding spaces.
+        # Compact writes raw UTF-8 like orjson; pretty keeps json.dump's \uXXXX escapes.
+        self._encoder = json.JSONEncoder(
+            indent=indent,
+            separators=(",", ": ") if indent else (",", ":"),
+            ensure_ascii=bool(indent),
+            default=_default,
+        )
+
+    def dumps(self, records):
+        return self._encoder.encode(records).encode("utf-8")
+
+    def dump(self, records, fp):
+        fp.write(self.dumps(records))
+
+
+class OrjsonSerializer:
+    """orjson backend. Serializes datetime natively (same text as .isoformat())."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, records):
+        return self._orjson.dumps(records)
+
+    def dump(self, records, fp):
+        fp.write(self._orjson.dumps(records))
+
+
+# =============================================================================
+# BACKEND SELECTION
+# =============================================================================
+SERIALIZERS = {
+    "pretty": lambda: StdlibSerializer(indent=2),
+    "compact": StdlibSerializer,
+    "orjson": OrjsonSerializer,
+}
+
+
+def get_serializer(name="auto"):
+    """Return a serializer by name; "auto" prefers orjson and falls back to compact."""
+    if name == "auto":
+        try:
+            return OrjsonSerializer()
+        except ImportError:
+            return StdlibSerializer()
+    if name not in SERIALIZERS:
+        raise ValueError(f"Unknown serializer '{name}'. Choose from: auto, {', '.join(SERIALIZERS)}")
+    return SERIALIZERS[name]()
+
+
+def write_records(filepath, records, serializer=None):
+    """Write a list of records as one JSON array to `filepath`; returns bytes written."""
+    serializer = serializer or get_serializer()
+    with open(filepath, "wb") as f:
+        serializer.dump(records, f)
+        return f.tell()
@@ -0,0 +1,128 @@
+"""
+Read the demo's .sql scripts as individual statements.
+
+The numbered scripts in the repository root are written for worksheets and
+SnowSQL. The orchestrator runs them statement by statement through a
+connector, and picks the per-entity stream/task statements out of them.
+They are not part of the installed package, so they are read from a
+directory given by the caller (the current directory by default).
+"""
+
+import re
+from pathlib import Path
+
+from snowpipe_demo.entities import DATABASE, ENTITIES, object_name
+
+SQL_DIR = Path(".")
+
+
+def split_sql(text):
+    """Split a script on ';', ignoring ';' inside quotes and dropping comments."""
+    statements = []
+    current = []
+    i = 0
+    in_quote = False
+    while i < len(text):
+        char = text[i]
+        if in_quote:
+            current.append(char)
+            if char == "'":
+                in_quote = False
+        elif text.startswith("--", i):
+            end = text.find("\n", i)
+            i = len(text) if end == -1 else end
+            continue
+        elif text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            i = len(text) if end == -1 else end + 2
+            continue
+        elif char == "'":
+            in_quote = True
+            current.append(char)
+        elif char == ";":
+            statements.append("".join(current).strip())
+            current = []
+        else:
+            current.append(char)
+        i += 1
+    statements.append("".join(current).strip())
+    return [s for s in statements if s]
+
+
+def load_statements(filename, sql_dir=SQL_DIR):
+    return split_sql((Path(sql_dir) / filename).read_text())
+
+
+def _dataset_pattern(dataset):
+    names = "|".join(sorted({object_name(dataset), dataset.upper()}))
+    return re.compile(rf"\b(?:STG|LATEST|PIPE)_(?:{names})(?:_FILES|_STREAM)?\b")
+
+
+def partition_statements(filename, sql_dir=SQL_DIR):
+    """
+    Split a script into statements about exactly one dataset and the rest.
+
+    Returns (shared statements, {dataset: statements}). Every per-dataset list
+    starts with the USE statement in effect, and repeats a USE whenever the
+    context changes, so it can run on its own session.
+    """
+    patterns = {dataset: _dataset_pattern(dataset) for dataset in ENTITIES}
+    shared = []
+    per_dataset = {}
+    last_context = {}
+    context = None
+    for statement in load_statements(filename, sql_dir):
+        if statement.upper().startswith("USE "):
+            context = statement
+            shared.append(statement)
+            continue
+        owners = [dataset for dataset, pattern in patterns.items() if pattern.search(statement)]
+        if len(owners) == 1:
+            statements = per_dataset.setdefault(owners[0], [])
+            if context and last_context.get(owners[0]) != context:
+                statements.append(context)
+                last_context[owners[0]] = context
+            statements.append(statement)
+        else:
+            shared.append(statement)
+    return shared, per_dataset
+
+
+def pipe_refresh_statement(dataset, sql_dir=SQL_DIR):
+    """
+    ALTER PIPE ... REFRESH for the pipe reading this dataset's stage.
+    AUTO_INGEST does not fire for internal stages, so files only load
+    after a refresh (as in 06_demo_file_upload.sql).
+    """
+    stage = f"STG_{dataset.upper()}_FILES"
+    for statement in load_statements("04_create_snowpipes.sql", sql_dir):
+        match = re.match(r"CREATE OR REPLACE PIPE (\w+)", statement)
+        if match and re.search(rf"\b{stage}\b", statement):
+            return f"ALTER PIPE {DATABASE}.STAGE_DATA.{match.group(1)} REFRESH"
+    raise ValueError(f"No pipe reads @{stage} in 04_create_snowpipes.sql")
+
+
+def stream_task_statements(dataset, sql_dir=SQL_DIR):
+    """
+    LATEST_* table (00_complete_reset_restart.sql, the one copy whose names
+    match the tasks), CREATE STREAM (05_*.sql), then DROP / CREATE / RESUME of
+    the corrected MERGE task (fix_merge_operations.sql) for one dataset.
+    """
+    name = object_name(dataset)
+    latest = f"CREATE OR REPLACE TABLE LATEST_{name} "
+    stream = f"CREATE OR REPLACE STREAM STG_{name}_STREAM"
+    task = f"PROCESS_{name}_STREAM"
+
+    statements = [f"USE SCHEMA {DATABASE}.LATEST_DATA"]
+    statements += [s for s in load_statements("00_complete_reset_restart.sql", sql_dir) if s.startswith(latest)]
+    statements.append(f"USE SCHEMA {DATABASE}.STAGE_DATA")
+    for filename in ("05_create_streams_and_tasks.sql", "05B_remaining_streams_tasks.sql"):
+        found = [s for s in load_statements(filename, sql_dir) if s.startswith(stream + " ")]
+        if found:
+            statements.append(found[0])
+            break
+    statements += [
+        s for s in load_statements("fix_merge_operations.sql", sql_dir)
+        if task in s.split() and not s.startswith("SELECT")
+    ]
+    return statements
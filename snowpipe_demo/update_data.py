@@ -0,0 +1,566 @@
+"""
+Enhanced Incremental Update Files Generator for Snowpipe + Streams + Tasks Demo
+
+Generates SEPARATE update files with timestamp naming to demonstrate:
+1. Initial load: customers.json (100 records, ID 1-100, DATA_VERSION = 1)
+2. Later updates: customers_update_timestamp.json containing:
+   - 10 UPDATE records: Existing IDs (1-100) with higher DATA_VERSION (2-4)
+   - 10 INSERT records: New IDs (101-110) with DATA_VERSION = 1
+
+This showcases both MERGE paths:
+- WHEN MATCHED: Updates existing records with higher DATA_VERSION
+- WHEN NOT MATCHED: Inserts completely new records
+
+Run with: snowpipe-demo generate-updates
+"""
+
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from faker import Faker
+
+from snowpipe_demo.scenarios import get_scenario, inject_rows, redeliver
+from snowpipe_demo.serializers import get_serializer, write_records
+
+# =============================================================================
+# 1. CUSTOMER UPDATES + NEW INSERTS
+# =============================================================================
+def generate_customer_updates(fake, rng):
+    updates = []
+    
+    # PART 1: 10 UPDATE records (existing IDs 1-100, higher DATA_VERSION)
+    customer_ids_to_update = rng.sample(range(1, 101), 10)  # Pick 10 existing customers
+    
+    for customer_id in customer_ids_to_update:
+        # Generate update with higher DATA_VERSION
+        version = rng.randint(2, 4)  # Version 2, 3, or 4
+        update = {
+            "CUSTOMER_ID": customer_id,
+            "CUSTOMER_NAME": fake.name(),
+            "EMAIL": fake.email(),
+            "PHONE": fake.phone_number(),
+            "ADDRESS": fake.street_address(),
+            "CITY": fake.city(),
+            "STATE": fake.state_abbr(),
+            "ZIP_CODE": fake.zipcode(),
+            "COUNTRY": "USA",
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": version,
+            "RECORD_STATUS": rng.choice(["ACTIVE", "INACTIVE", "PENDING"])
+        }
+        updates.append(update)
+    
+    # PART 2: 10 INSERT records (new IDs 101-110, DATA_VERSION = 1)
+    for customer_id in range(101, 111):  # New customers 101-110
+        insert = {
+            "CUSTOMER_ID": customer_id,
+            "CUSTOMER_NAME": fake.name(),
+            "EMAIL": fake.email(),
+            "PHONE": fake.phone_number(),
+            "ADDRESS": fake.street_address(),
+            "CITY": fake.city(),
+            "STATE": fake.state_abbr(),
+            "ZIP_CODE": fake.zipcode(),
+            "COUNTRY": "USA",
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": 1,  # New records start with version 1
+            "RECORD_STATUS": "ACTIVE"
+        }
+        updates.append(insert)
+    
+    return updates
+
+# =============================================================================
+# 2. PRODUCT UPDATES + NEW INSERTS
+# =============================================================================
+def generate_product_updates(fake, rng):
+    updates = []
+    categories = ["Electronics", "Clothing", "Home & Garden", "Books", "Sports", "Beauty", "Automotive", "Food", "Toys", "Health"]
+    
+    # PART 1: 10 UPDATE records (existing IDs 1-100, higher DATA_VERSION)
+    product_ids_to_update = rng.sample(range(1, 101), 10)
+    
+    for product_id in product_ids_to_update:
+        version = rng.randint(2, 4)
+        update = {
+            "PRODUCT_ID": product_id,
+            "PRODUCT_NAME": fake.catch_phrase().replace(",", ""),
+            "CATEGORY": rng.choice(categories),
+            "PRICE": round(rng.uniform(9.99, 999.99), 2),
+            "SUPPLIER_ID": rng.randint(1, 25),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": version,
+            "RECORD_STATUS": rng.choice(["ACTIVE", "DISCONTINUED", "OUT_OF_STOCK"])
+        }
+        updates.append(update)
+    
+    # PART 2: 10 INSERT records (new IDs 101-110, DATA_VERSION = 1)
+    for product_id in range(101, 111):
+        insert = {
+            "PRODUCT_ID": product_id,
+            "PRODUCT_NAME": fake.catch_phrase().replace(",", ""),
+            "CATEGORY": rng.choice(categories),
+            "PRICE": round(rng.uniform(9.99, 999.99), 2),
+            "SUPPLIER_ID": rng.randint(1, 25),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": 1,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        updates.append(insert)
+    
+    return updates
+
+# =============================================================================
+# 3. ORDER UPDATES + NEW INSERTS
+# =============================================================================
+def generate_order_updates(fake, rng):
+    updates = []
+    statuses = ["PENDING", "PROCESSING", "SHIPPED", "DELIVERED", "CANCELLED"]
+    
+    # PART 1: 10 UPDATE records (existing IDs 1-100, higher DATA_VERSION)
+    order_ids_to_update = rng.sample(range(1, 101), 10)
+    
+    for order_id in order_ids_to_update:
+        version = rng.randint(2, 4)
+        update = {
+            "ORDER_ID": order_id,
+            "CUSTOMER_ID": rng.randint(1, 110),  # Can reference new customers too
+            "ORDER_DATE": (datetime.now() - timedelta(days=rng.randint(1, 60))).strftime('%Y-%m-%d'),
+            "TOTAL_AMOUNT": round(rng.uniform(25.00, 1500.00), 2),
+            "ORDER_STATUS": rng.choice(statuses),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": version,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        updates.append(update)
+    
+    # PART 2: 10 INSERT records (new IDs 101-110, DATA_VERSION = 1)
+    for order_id in range(101, 111):
+        insert = {
+            "ORDER_ID": order_id,
+            "CUSTOMER_ID": rng.randint(1, 110),
+            "ORDER_DATE": (datetime.now() - timedelta(days=rng.randint(1, 60))).strftime('%Y-%m-%d'),
+            "TOTAL_AMOUNT": round(rng.uniform(25.00, 1500.00), 2),
+            "ORDER_STATUS": rng.choice(statuses),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": 1,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        updates.append(insert)
+    
+    return updates
+
+# =============================================================================
+# 4. ORDER ITEM UPDATES + NEW INSERTS
+# =============================================================================
+def generate_order_item_updates(fake, rng):
+    updates = []
+    
+    # PART 1: 10 UPDATE records
+    item_ids_to_update = rng.sample(range(1, 101), 10)
+    
+    for item_id in item_ids_to_update:
+        version = rng.randint(2, 4)
+        update = {
+            "ORDER_ITEM_ID": item_id,
+            "ORDER_ID": rng.randint(1, 110),  # Can reference new orders
+            "PRODUCT_ID": rng.randint(1, 110),  # Can reference new products
+            "QUANTITY": rng.randint(1, 10),
+            "UNIT_PRICE": round(rng.uniform(9.99, 299.99), 2),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": version,
+            "RECORD_STATUS": rng.choice(["ACTIVE", "CANCELLED", "RETURNED"])
+        }
+        updates.append(update)
+    
+    # PART 2: 10 INSERT records
+    for item_id in range(101, 111):
+        insert = {
+            "ORDER_ITEM_ID": item_id,
+            "ORDER_ID": rng.randint(1, 110),
+            "PRODUCT_ID": rng.randint(1, 110),
+            "QUANTITY": rng.randint(1, 10),
+            "UNIT_PRICE": round(rng.uniform(9.99, 299.99), 2),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": 1,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        updates.append(insert)
+    
+    return updates
+
+# =============================================================================
+# 5. SUPPLIER UPDATES + NEW INSERTS
+# =============================================================================
+def generate_supplier_updates(fake, rng):
+    updates = []
+    
+    # PART 1: 10 UPDATE records
+    supplier_ids_to_update = rng.sample(range(1, 101), 10)
+    
+    for supplier_id in supplier_ids_to_update:
+        version = rng.randint(2, 4)
+        update = {
+            "SUPPLIER_ID": supplier_id,
+            "SUPPLIER_NAME": fake.company(),
+            "CONTACT_EMAIL": fake.company_email(),
+            "CONTACT_PHONE": fake.phone_number(),
+            "ADDRESS": fake.address().replace('\n', ', '),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": version,
+            "RECORD_STATUS": rng.choice(["ACTIVE", "INACTIVE", "UNDER_REVIEW"])
+        }
+        updates.append(update)
+    
+    # PART 2: 10 INSERT records
+    for supplier_id in range(101, 111):
+        insert = {
+            "SUPPLIER_ID": supplier_id,
+            "SUPPLIER_NAME": fake.company(),
+            "CONTACT_EMAIL": fake.company_email(),
+            "CONTACT_PHONE": fake.phone_number(),
+            "ADDRESS": fake.address().replace('\n', ', '),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": 1,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        updates.append(insert)
+    
+    return updates
+
+# =============================================================================
+# 6. INVENTORY UPDATES + NEW INSERTS
+# =============================================================================
+def generate_inventory_updates(fake, rng):
+    updates = []
+    
+    # PART 1: 10 UPDATE records
+    inventory_ids_to_update = rng.sample(range(1, 101), 10)
+    
+    for inventory_id in inventory_ids_to_update:
+        version = rng.randint(2, 4)
+        update = {
+            "INVENTORY_ID": inventory_id,
+            "PRODUCT_ID": rng.randint(1, 110),  # Can reference new products
+            "WAREHOUSE_ID": rng.randint(1, 20),
+            "QUANTITY_ON_HAND": rng.randint(0, 1000),
+            "REORDER_LEVEL": rng.randint(10, 50),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": version,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        updates.append(update)
+    
+    # PART 2: 10 INSERT records
+    for inventory_id in range(101, 111):
+        insert = {
+            "INVENTORY_ID": inventory_id,
+            "PRODUCT_ID": rng.randint(1, 110),
+            "WAREHOUSE_ID": rng.randint(1, 20),
+            "QUANTITY_ON_HAND": rng.randint(0, 1000),
+            "REORDER_LEVEL": rng.randint(10, 50),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": 1,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        updates.append(insert)
+    
+    return updates
+
+# =============================================================================
+# 7. WAREHOUSE UPDATES + NEW INSERTS
+# =============================================================================
+def generate_warehouse_updates(fake, rng):
+    updates = []
+    
+    # PART 1: 10 UPDATE records
+    warehouse_ids_to_update = rng.sample(range(1, 101), 10)
+    
+    for warehouse_id in warehouse_ids_to_update:
+        version = rng.randint(2, 4)
+        update = {
+            "WAREHOUSE_ID": warehouse_id,
+            "WAREHOUSE_NAME": f"Warehouse {fake.city()} {warehouse_id}",
+            "LOCATION": f"{fake.city()}, {fake.state_abbr()}",
+            "MANAGER_ID": rng.randint(1, 110),  # Can reference new employees
+            "CAPACITY": rng.randint(10000, 100000),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": version,
+            "RECORD_STATUS": rng.choice(["ACTIVE", "MAINTENANCE", "CLOSED"])
+        }
+        updates.append(update)
+    
+    # PART 2: 10 INSERT records
+    for warehouse_id in range(101, 111):
+        insert = {
+            "WAREHOUSE_ID": warehouse_id,
+            "WAREHOUSE_NAME": f"Warehouse {fake.city()} {warehouse_id}",
+            "LOCATION": f"{fake.city()}, {fake.state_abbr()}",
+            "MANAGER_ID": rng.randint(1, 110),
+            "CAPACITY": rng.randint(10000, 100000),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": 1,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        updates.append(insert)
+    
+    return updates
+
+# =============================================================================
+# 8. EMPLOYEE UPDATES + NEW INSERTS
+# =============================================================================
+def generate_employee_updates(fake, rng):
+    updates = []
+    departments = ["Sales", "Marketing", "Engineering", "HR", "Finance", "Operations"]
+    
+    # PART 1: 10 UPDATE records
+    employee_ids_to_update = rng.sample(range(1, 101), 10)
+    
+    for employee_id in employee_ids_to_update:
+        version = rng.randint(2, 4)
+        update = {
+            "EMPLOYEE_ID": employee_id,
+            "FIRST_NAME": fake.first_name(),
+            "LAST_NAME": fake.last_name(),
+            "EMAIL": fake.email(),
+            "PHONE": fake.phone_number(),
+            "DEPARTMENT": rng.choice(departments),
+            "SALARY": round(rng.uniform(40000, 180000), 2),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": version,
+            "RECORD_STATUS": rng.choice(["ACTIVE", "ON_LEAVE", "TERMINATED"])
+        }
+        updates.append(update)
+    
+    # PART 2: 10 INSERT records
+    for employee_id in range(101, 111):
+        insert = {
+            "EMPLOYEE_ID": employee_id,
+            "FIRST_NAME": fake.first_name(),
+            "LAST_NAME": fake.last_name(),
+            "EMAIL": fake.email(),
+            "PHONE": fake.phone_number(),
+            "DEPARTMENT": rng.choice(departments),
+            "SALARY": round(rng.uniform(35000, 150000), 2),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": 1,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        updates.append(insert)
+    
+    return updates
+
+# =============================================================================
+# 9. TERRITORY UPDATES + NEW INSERTS
+# =============================================================================
+def generate_territory_updates(fake, rng):
+    updates = []
+    regions = ["North", "South", "East", "West", "Central"]
+    
+    # PART 1: 10 UPDATE records
+    territory_ids_to_update = rng.sample(range(1, 101), 10)
+    
+    for territory_id in territory_ids_to_update:
+        version = rng.randint(2, 4)
+        update = {
+            "TERRITORY_ID": territory_id,
+            "TERRITORY_NAME": f"{fake.state()} {rng.choice(['North', 'South', 'Metro', 'Valley'])}",
+            "REGION": rng.choice(regions),
+            "MANAGER_ID": rng.randint(1, 110),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": version,
+            "RECORD_STATUS": rng.choice(["ACTIVE", "INACTIVE", "RESTRUCTURED"])
+        }
+        updates.append(update)
+    
+    # PART 2: 10 INSERT records
+    for territory_id in range(101, 111):
+        insert = {
+            "TERRITORY_ID": territory_id,
+            "TERRITORY_NAME": f"{fake.state()} {rng.choice(['North', 'South', 'Metro', 'Valley'])}",
+            "REGION": rng.choice(regions),
+            "MANAGER_ID": rng.randint(1, 110),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": 1,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        updates.append(insert)
+    
+    return updates
+
+# =============================================================================
+# 10. PROMOTION UPDATES + NEW INSERTS
+# =============================================================================
+def generate_promotion_updates(fake, rng):
+    updates = []
+    
+    # PART 1: 10 UPDATE records
+    promotion_ids_to_update = rng.sample(range(1, 101), 10)
+    
+    for promotion_id in promotion_ids_to_update:
+        version = rng.randint(2, 4)
+        update = {
+            "PROMOTION_ID": promotion_id,
+            "PROMOTION_NAME": f"{fake.catch_phrase().replace(',', '')} Sale",
+            "DISCOUNT_PERCENTAGE": round(rng.uniform(5.0, 50.0), 2) if rng.choice([True, False]) else None,
+            "START_DATE": (datetime.now() - timedelta(days=rng.randint(30, 90))).strftime('%Y-%m-%d'),
+            "END_DATE": (datetime.now() + timedelta(days=rng.randint(30, 180))).strftime('%Y-%m-%d'),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": version,
+            "RECORD_STATUS": rng.choice(["ACTIVE", "EXPIRED", "PAUSED"])
+        }
+        updates.append(update)
+    
+    # PART 2: 10 INSERT records
+    for promotion_id in range(101, 111):
+        insert = {
+            "PROMOTION_ID": promotion_id,
+            "PROMOTION_NAME": f"{fake.catch_phrase().replace(',', '')} Sale",
+            "DISCOUNT_PERCENTAGE": round(rng.uniform(5.0, 50.0), 2) if rng.choice([True, False]) else None,
+            "START_DATE": (datetime.now() - timedelta(days=rng.randint(30, 90))).strftime('%Y-%m-%d'),
+            "END_DATE": (datetime.now() + timedelta(days=rng.randint(30, 180))).strftime('%Y-%m-%d'),
+            "RECORD_TIMESTAMP": datetime.now() - timedelta(minutes=rng.randint(10, 120)),
+            "DATA_VERSION": 1,
+            "RECORD_STATUS": "ACTIVE"
+        }
+        updates.append(insert)
+    
+    return updates
+
+# =============================================================================
+# GENERATE AND SAVE SEPARATE UPDATE FILES
+# =============================================================================
+UPDATE_GENERATORS = {
+    "customers": generate_customer_updates,
+    "products": generate_product_updates,
+    "orders": generate_order_updates,
+    "order_items": generate_order_item_updates,
+    "suppliers": generate_supplier_updates,
+    "inventory": generate_inventory_updates,
+    "warehouses": generate_warehouse_updates,
+    "employees": generate_employee_updates,
+    "sales_territories": generate_territory_updates,
+    "promotions": generate_promotion_updates
+}
+
+
+def generate_updates(seed=300):
+    """Build every update dataset in memory: {dataset name: records}."""
+    fake = Faker()
+    fake.seed_instance(seed)  # Different seed for enhanced updates
+    rng = random.Random(seed)
+    return {dataset_name: generator(fake, rng) for dataset_name, generator in UPDATE_GENERATORS.items()}
+
+
+def generate_dataset_updates(dataset_name, seed=300):
+    """Build one update dataset with its own Faker/RNG, safe to run concurrently."""
+    fake = Faker()
+    fake.seed_instance(f"{seed}:{dataset_name}")
+    return UPDATE_GENERATORS[dataset_name](fake, random.Random(f"{seed}:{dataset_name}"))
+
+
+def main(output_dir="sample_data", serializer="auto", seed=300, scenario="clean",
+         duplicate_file_rate=None, duplicate_row_rate=None, late_arrival_rate=None):
+    data_dir = Path(output_dir)
+    data_dir.mkdir(exist_ok=True)
+
+    # Compact JSON writer (orjson when installed); RECORD_TIMESTAMP stays a datetime
+    serializer = get_serializer(serializer)
+
+    # Generate timestamp for file naming
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    # Optional delivery faults (see scenarios.py); own RNG so the clean records never change
+    rates = get_scenario(scenario, duplicate_file_rate=duplicate_file_rate,
+                         duplicate_row_rate=duplicate_row_rate, late_arrival_rate=late_arrival_rate)
+    injecting = any(rates.values())
+    scenario_rng = random.Random(f"{seed}:scenario")
+
+    print("🔄 Generating ENHANCED INCREMENTAL UPDATE files (10 updates + 10 new records each)...")
+    print(f"📅 Timestamp: {timestamp}")
+    if injecting:
+        print(f"🧪 Scenario '{scenario}': " + ", ".join(f"{key}={value:g}" for key, value in rates.items()))
+
+    print("\n📊 CREATING ENHANCED UPDATE FILES (10 updates + 10 new records each):")
+    total_update_records = 0
+    total_update_files = 0
+
+    # Create separate update files with timestamp
+    for dataset_name, updates in generate_updates(seed).items():
+        if updates:  # Only create file if there are updates
+            # Create timestamped filename
+            update_filename = f"{dataset_name}_update_{timestamp}.json"
+            filepath = data_dir / update_filename
+
+            if injecting:
+                clean_count = len(updates)
+                updates, late = inject_rows(updates, rates, scenario_rng)
+
+            # Save update records to separate file
+            size = write_records(filepath, updates, serializer)
+
+            total_update_records += len(updates)
+            total_update_files += 1
+            if not injecting:
+                print(f"✅ Created {update_filename}: {len(updates)} records (10 updates + 10 new, {size:,} bytes)")
+                continue
+            print(f"✅ Created {update_filename}: {len(updates)} records "
+                  f"({clean_count} clean + {len(updates) - clean_count} injected, {size:,} bytes)")
+
+            # Redelivery: same rows under a new name, so Snowpipe loads them again
+            if redeliver(rates, scenario_rng):
+                duplicate_filename = f"{dataset_name}_update_{timestamp}_redelivered.json"
+                write_records(data_dir / duplicate_filename, updates, serializer)
+                total_update_records += len(updates)
+                total_update_files += 1
+                print(f"   ♻️  Redelivered as {duplicate_filename}: {len(updates)} records")
+
+            # Stale lower-version copies in their own file, to be PUT after the task merged this one
+            if late:
+                late_filename = f"{dataset_name}_update_{timestamp}_late.json"
+                write_records(data_dir / late_filename, late, serializer)
+                total_update_records += len(late)
+                total_update_files += 1
+                print(f"   🐢 Late arrivals in {late_filename}: {len(late)} stale records")
+
+    print(f"\n🎉 Enhanced incremental update files generation complete!")
+    print(f"📁 Location: {data_dir.absolute()}")
+    print(f"📈 Total update files: {total_update_files}")
+    print(f"🧾 Serializer: {serializer.name}")
+    print(f"📊 Total records: {total_update_records}" + ("" if injecting else " (200 records total)"))
+    late_written = any(data_dir.glob(f"*_update_{timestamp}_late.json"))
+
+    print(f"\n🎯 PERFECT MERGE DEMO STRUCTURE:")
+    print("1. 📋 Initial load (per dataset):")
+    print("   • IDs 1-100, DATA_VERSION = 1")
+
+    print(f"\n2. 🔄 Update files (per dataset):")
+    print("   • 10 UPDATE records: Existing IDs (random from 1-100), DATA_VERSION 2-4")
+    print("   • 10 INSERT records: New IDs (101-110), DATA_VERSION = 1")
+
+    print(f"\n💡 MERGE BEHAVIOR DEMONSTRATION:")
+    print("   • WHEN MATCHED + higher DATA_VERSION → UPDATE existing records")
+    print("   • WHEN NOT MATCHED → INSERT new records (IDs 101-110)")
+    print("   • Perfect showcase of both MERGE paths!")
+
+    print(f"\n📝 DEMO STEPS:")
+    print("1. Upload initial files: snowpipe-demo upload --initial-only (or @06_demo_file_upload.sql)")
+    print("2. Create Streams & Tasks: @05_create_streams_and_tasks.sql")
+    print("3. Upload update files: snowpipe-demo upload --updates-only (or @06B_upload_update_files.sql)")
+    if late_written:
+        print("3b. After the tasks have merged them: snowpipe-demo upload --late-only (stale late arrivals)")
+    print("4. Monitor pipeline: @07_demo_monitoring_validation.sql")
+
+    if injecting:
+        print(f"\n🎪 EXPECTED FINAL RESULTS:")
+        print(f"  • Stage tables: 100 initial records per dataset + {total_update_records} update records "
+              f"across all update files (injected faults included)")
+        print("  • Latest tables: still 110 unique records per dataset - duplicates and stale versions never win")
+        print("  • snowpipe-demo check-replay --from-files confirms the LATEST state offline")
+        return
+
+    print(f"\n🎪 EXPECTED FINAL RESULTS:")
+    print("  • Stage tables: 120 total records per dataset (100 initial + 20 updates)")
+    print("  • Latest tables: 110 unique records per dataset (IDs 1-110, latest versions only)")
+    print("  • Demonstrates both UPDATE and INSERT merge behavior perfectly!")
@@ -0,0 +1,60 @@
+"""
+Build the PUT commands that upload generated files to their internal stages.
+
+Equivalent to 06_demo_file_upload.sql / 06B_upload_update_files.sql, but with
+the real absolute paths of the files on this machine. The statements are
+printed (or written to --output) so they can be run with SnowSQL or pasted
+into a worksheet.
+
+*_late.json files (stale late arrivals from generate-updates --scenario) are
+left out of the initial/update upload. Put in the same load as their update
+file, the MERGE's ROW_NUMBER dedupe would drop them before the DATA_VERSION
+guard, so they are uploaded on their own with --late-only once the tasks have
+merged the update files.
+"""
+
+from pathlib import Path
+
+from snowpipe_demo.entities import ENTITIES, dataset_of, is_late_file, is_update_file, stage_name
+
+
+def put_statement(filepath):
+    """PUT for one file into its dataset's stage."""
+    # Quoted file:// URI so paths with spaces work (see note in 06_demo_file_upload.sql)
+    return f"PUT 'file://{Path(filepath).absolute().as_posix()}' @{stage_name(dataset_of(Path(filepath)))};"
+
+
+def _selected(filepath, initial, updates, late):
+    if is_late_file(filepath):
+        return late
+    return updates if is_update_file(filepath) else initial
+
+
+def put_statements(data_dir="sample_data", initial=True, updates=True, late=False):
+    """One PUT per file, in dataset order, initial files before update files."""
+    files = [
+        f for f in Path(data_dir).glob("*.json")
+        if dataset_of(f) in ENTITIES and _selected(f, initial, updates, late)
+    ]
+    order = list(ENTITIES)
+    files.sort(key=lambda f: (is_update_file(f), order.index(dataset_of(f)), f.name))
+    return [put_statement(f) for f in files]
+
+
+def main(data_dir="sample_data", initial=True, updates=True, output=None, late=False):
+    statements = put_statements(data_dir, initial, updates, late)
+    if not statements:
+        print(f"❌ No matching JSON files found in {data_dir}/")
+        return 1
+
+    script = "\n".join(statements) + "\n"
+    held_back = [] if late or not updates else [f for f in Path(data_dir).glob("*_late.json") if is_late_file(f)]
+    if held_back:
+        script += (f"-- {len(held_back)} *_late.json files held back: run `snowpipe-demo upload --late-only`"
+                   " after the tasks have merged these update files\n")
+    if output:
+        Path(output).write_text(script)
+        print(f"✅ Wrote {len(statements)} PUT commands to {output}")
+    else:
+        print(script, end="")
+    return 0
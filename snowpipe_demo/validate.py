@@ -0,0 +1,85 @@
+"""
+Validate generated JSON files before they are PUT to the stages.
+
+Checks every *.json file in the data directory:
+1. Parses as a JSON array of objects (what STRIP_OUTER_ARRAY = TRUE expects)
+2. Belongs to one of the ten demo datasets and carries its key column
+3. DATA_VERSION is a positive integer (always 1 in initial files)
+4. RECORD_TIMESTAMP is an ISO timestamp
+Duplicate keys inside one file are reported as warnings, not errors.
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+from snowpipe_demo.entities import ENTITIES, dataset_of, is_update_file
+
+
+def validate_file(filepath):
+    """Return (record count, [errors], [warnings]) for one file."""
+    dataset = dataset_of(filepath)
+    if dataset not in ENTITIES:
+        return 0, [f"unknown dataset '{dataset}'"], []
+
+    try:
+        with open(filepath, "rb") as f:
+            records = json.load(f)
+    except ValueError as e:
+        return 0, [f"invalid JSON: {e}"], []
+    if not isinstance(records, list):
+        return 0, ["top level is not a JSON array"], []
+
+    key = ENTITIES[dataset]
+    errors = []
+    seen = set()
+    duplicates = 0
+    for i, record in enumerate(records):
+        if not isinstance(record, dict):
+            errors.append(f"record {i}: not a JSON object")
+            continue
+        if not isinstance(record.get(key), int):
+            errors.append(f"record {i}: missing or non-integer {key}")
+        elif record[key] in seen:
+            duplicates += 1
+        else:
+            seen.add(record[key])
+
+        version = record.get("DATA_VERSION")
+        if not isinstance(version, int) or version < 1:
+            errors.append(f"record {i}: DATA_VERSION must be a positive integer, got {version!r}")
+        elif version != 1 and not is_update_file(filepath):
+            errors.append(f"record {i}: initial files must have DATA_VERSION = 1, got {version}")
+
+        try:
+            datetime.fromisoformat(record.get("RECORD_TIMESTAMP"))
+        except (TypeError, ValueError):
+            errors.append(f"record {i}: RECORD_TIMESTAMP is not an ISO timestamp")
+
+    warnings = [f"{duplicates} duplicate {key} values"] if duplicates else []
+    return len(records), errors, warnings
+
+
+def main(data_dir="sample_data"):
+    files = sorted(Path(data_dir).glob("*.json"))
+    if not files:
+        print(f"❌ No JSON files found in {data_dir}/")
+        return 1
+
+    failed = 0
+    total = 0
+    for filepath in files:
+        count, errors, warnings = validate_file(filepath)
+        total += count
+        if errors:
+            failed += 1
+            print(f"❌ {filepath.name}: {len(errors)} errors")
+            for error in errors[:5]:
+                print(f"   • {error}")
+        else:
+            print(f"✅ {filepath.name}: {count} records")
+        for warning in warnings:
+            print(f"   ⚠️  {warning}")
+
+    print(f"\n📊 {len(files)} files, {total:,} records, {failed} failed")
+    return 1 if failed else 0
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Row-Level Streaming Ingestion for Snowpipe + Streams + Tasks Demo
+
+Alternative to the file → stage → AUTO_INGEST pipe path. Change events are
+sent as micro-batches over one channel per entity, modelled on the Snowpipe
+Streaming API:
+1. open_channel(name)                  - one channel per STG_* table
+2. insert_rows(rows, offset_token)     - offset tokens increase monotonically
+3. get_latest_committed_offset_token() - where a restarted producer resumes
+
+LocalSink is the stand-in used for the demo: it persists every batch under
+streaming_sink/<channel>/ and acknowledges the offset only after the batch
+is safely on disk, so a crashed producer resumes exactly where it stopped.
+Batches persisted but never committed (a crash between the two) are
+discarded when the channel is reopened, so they can never be counted twice.
+
+Usage:
+  python streaming_ingest.py                      # stream sample_data/ into the local sink
+  python streaming_ingest.py --crash-after 5      # simulate a crash, re-run to resume
+  python streaming_ingest.py --crash-after 5 --crash-point persisted --batch-size 7
+                                                  # crash before the 5th offset commit, resume with another batch size
+  python streaming_ingest.py --compare            # latency/throughput vs file-based path
+  python streaming_ingest.py --compare --pipe-latency-ms 60000
+
+The file-drop latency in --compare is time to write the file plus
+--pipe-latency-ms, a modelled stage → pipe → visible-in-table delay (no real
+Snowpipe runs here), so both rows measure event emitted → rows queryable.
+
+Exit status: 0 on success, 1 when the sink does not hold every event exactly
+once (or there is no input), 3 after a --crash-after simulated crash.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+
+from snowpipe_demo.serializers import get_serializer, write_records
+
+data_dir = Path("sample_data")
+
+# =============================================================================
+# SINK INTERFACE
+# =============================================================================
+class StreamingChannel(ABC):
+    """One ordered stream of rows into a single table."""
+
+    @abstractmethod
+    def insert_rows(self, rows, offset_token):
+        """Send one batch; offset_token must be greater than the committed one."""
+
+    @abstractmethod
+    def get_latest_committed_offset_token(self):
+        """Last acknowledged offset token, or None for a new channel."""
+
+
+class StreamingSink(ABC):
+    """Pluggable destination for streamed rows (local stand-in or a real client)."""
+
+    @abstractmethod
+    def open_channel(self, name):
+        """Open (or reopen) the named channel."""
+
+
+class SimulatedCrash(Exception):
+    pass
+
+
+# =============================================================================
+# LOCAL STAND-IN SINK
+# =============================================================================
+class LocalChannel(StreamingChannel):
+    """Persists each batch as <offset>.json, then commits the offset atomically."""
+
+    def __init__(self, channel_dir, serializer, before_commit=None):
+        self.channel_dir = channel_dir
+        self.channel_dir.mkdir(parents=True, exist_ok=True)
+        self.offset_file = channel_dir / "committed_offset"
+        self.serializer = serializer
+        self.before_commit = before_commit
+        self._discard_uncommitted()
+
+    def _discard_uncommitted(self):
+        """Drop batches a crash left persisted but never committed."""
+        committed = self.get_latest_committed_offset_token() or 0
+        for leftover in self.channel_dir.glob("*.tmp"):
+            leftover.unlink()
+        for batch_file in self.channel_dir.glob("*.json"):
+            if int(batch_file.stem) > committed:
+                batch_file.unlink()
+
+    def insert_rows(self, rows, offset_token):
+        committed = self.get_latest_committed_offset_token()
+        if committed is not None and offset_token <= committed:
+            raise ValueError(f"Offset token {offset_token} is not greater than committed {committed}")
+
+        # Batch file is keyed by offset, so re-sending an uncommitted batch overwrites it
+        batch_file = self.channel_dir / f"{offset_token:012d}.json"
+        tmp_file = batch_file.with_suffix(".tmp")
+        write_records(tmp_file, rows, self.serializer)
+        os.replace(tmp_file, batch_file)
+        if self.before_commit:
+            self.before_commit()
+
+        tmp_offset = self.offset_file.with_suffix(".tmp")
+        tmp_offset.write_text(str(offset_token))
+        os.replace(tmp_offset, self.offset_file)
+        return offset_token
+
+    def get_latest_committed_offset_token(self):
+        if not self.offset_file.exists():
+            return None
+        return int(self.offset_file.read_text())
+
+    def committed_rows(self):
+        """All rows acknowledged so far, in offset order."""
+        committed = self.get_latest_committed_offset_token() or 0
+        rows = []
+        for batch_file in sorted(self.channel_dir.glob("*.json")):
+            if int(batch_file.stem) <= committed:
+                with open(batch_file, "rb") as f:
+                    rows.extend(json.load(f))
+        return rows
+
+
+class LocalSink(StreamingSink):
+    def __init__(self, sink_dir, serializer=None, crash_before_commit=None):
+        """crash_before_commit=N raises SimulatedCrash after the Nth batch is persisted, before its commit."""
+        self.sink_dir = Path(sink_dir)
+        self.serializer = serializer or get_serializer()
+        self.crash_before_commit = crash_before_commit
+        self.persisted = 0
+
+    def _before_commit(self):
+        self.persisted += 1
+        if self.persisted >= self.crash_before_commit:
+            raise SimulatedCrash(f"Simulated crash after persisting batch {self.persisted}, before its commit")
+
+    def open_channel(self, name):
+        hook = self._before_commit if self.crash_before_commit else None
+        return LocalChannel(self.sink_dir / name, self.serializer, hook)
+
+
+# =============================================================================
+# PRODUCER
+# =============================================================================
+
+def load_change_events():
+    """Change events per entity from sample_data/ (initial file first, then updates)."""
+    events = {}
+    for filepath in sorted(data_dir.glob("*.json"), key=lambda p: ("_update_" in p.stem, p.name)):
+        entity = filepath.stem.split("_update_")[0]
+        with open(filepath) as f:
+            records = json.load(f)
+        for record in records:
+            record["RECORD_TIMESTAMP"] = datetime.fromisoformat(record["RECORD_TIMESTAMP"])
+        events.setdefault(entity, []).extend(records)
+    return events
+
+
+def stream_events(sink, events, batch_size, crash_after=None, rate=0):
+    """
+    Send each entity's events as micro-batches. The offset token of a batch is
+    the 1-based position of its last event, so a restart skips every event at
+    or below the channel's committed offset.
+
+    Returns (rows sent, per-event latencies in seconds).
+    """
+    sent = 0
+    batches = 0
+    latencies = []
+    for entity, records in events.items():
+        channel = sink.open_channel(f"{entity.upper()}_CHANNEL")
+        start = channel.get_latest_committed_offset_token() or 0
+        if start:
+            print(f"↩️  {entity}: resuming after committed offset {start}")
+
+        for batch_start in range(start, len(records), batch_size):
+            batch = records[batch_start:batch_start + batch_size]
+            emitted = []
+            for _ in batch:
+                if rate:
+                    time.sleep(1 / rate)
+                emitted.append(time.perf_counter())
+
+            channel.insert_rows(batch, batch_start + len(batch))
+            committed_at = time.perf_counter()
+            latencies.extend(committed_at - t for t in emitted)
+            sent += len(batch)
+            batches += 1
+
+            if crash_after and batches >= crash_after:
+                raise SimulatedCrash(f"Simulated crash after {batches} batches ({sent} rows)")
+    return sent, latencies
+
+
+def file_drop_events(out_dir, events, rate=0, pipe_latency=0.0):
+    """
+    Same workload through the file path: one file per entity. Rows become
+    visible `pipe_latency` seconds after the file is written (stage → pipe →
+    COPY into the table), which is modelled rather than slept.
+    """
+    serializer = get_serializer()
+    sent = 0
+    latencies = []
+    for entity, records in events.items():
+        emitted = []
+        for _ in records:
+            if rate:
+                time.sleep(1 / rate)
+            emitted.append(time.perf_counter())
+        write_records(out_dir / f"{entity}.json", records, serializer)
+        written_at = time.perf_counter()
+        latencies.extend(written_at - t + pipe_latency for t in emitted)
+        sent += len(records)
+    return sent, latencies
+
+
+# =============================================================================
+# REPORTING
+# =============================================================================
+def summarize(label, rows, elapsed, latencies):
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1] if ordered else 0
+    print(f"{label:<12}{rows:>8,}{rows / elapsed:>14,.0f}"
+          f"{statistics.mean(latencies) * 1000:>14.2f}{p95 * 1000:>12.2f}")
+
+
+def compare(events, batch_size, rate, pipe_latency_ms):
+    print(f"\n⚖️  STREAMING vs FILE DROP (batch size {batch_size}, rate {rate or 'unthrottled'} events/sec, "
+          f"pipe latency {pipe_latency_ms:,.0f} ms)")
+    print(f"{'PATH':<12}{'ROWS':>8}{'ROWS/SEC':>14}{'MEAN LAT ms':>14}{'P95 LAT ms':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        rows, latencies = stream_events(LocalSink(Path(tmp) / "sink"), events, batch_size, rate=rate)
+        summarize("streaming", rows, time.perf_counter() - start, latencies)
+
+        files_dir = Path(tmp) / "files"
+        files_dir.mkdir()
+        start = time.perf_counter()
+        rows, latencies = file_drop_events(files_dir, events, rate=rate, pipe_latency=pipe_latency_ms / 1000)
+        summarize("file drop", rows, time.perf_counter() - start, latencies)
+    print("   Latency is event emitted → committed (streaming) or file written + modelled pipe load (file drop).")
+    print("   ROWS/SEC is local producer throughput and does not include the modelled pipe latency.")
+
+
+def verify(sink, events):
+    """Every channel must hold exactly its events, once each, in order."""
+    ok = True
+    for entity, records in events.items():
+        channel = sink.open_channel(f"{entity.upper()}_CHANNEL")
+        expected = json.loads(json.dumps(records, default=datetime.isoformat))
+        if channel.committed_rows() != expected:
+            print(f"❌ {entity}: committed rows do not match the source events")
+            ok = False
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream change events over channels to a pluggable sink")
+    parser.add_argument("--sink-dir", default="streaming_sink", help="Directory for the local stand-in sink")
+    parser.add_argument("--batch-size", type=int, default=50, help="Rows per micro-batch")
+    parser.add_argument("--rate", type=float, default=0, help="Throttle to N events/sec (0 = unthrottled)")
+    parser.add_argument("--crash-after", type=int, help="Simulate a crash at the Nth batch")
+    parser.add_argument("--crash-point", default="committed", choices=["committed", "persisted"],
+                        help="Crash after the batch's offset commit, or after persisting it but before the commit")
+    parser.add_argument("--reset", action="store_true", help="Delete the sink directory before streaming")
+    parser.add_argument("--compare", action="store_true", help="Compare against the file-based path")
+    parser.add_argument("--pipe-latency-ms", type=float, default=30000,
+                        help="Modelled stage → pipe → visible delay per file for --compare (default 30 s)")
+    args = parser.parse_args()
+
+    events = load_change_events()
+    if not events:
+        print(f"❌ No JSON files found in {data_dir}/ - run generate_initial_data.py first")
+        return 1
+
+    if args.compare:
+        compare(events, args.batch_size, args.rate, args.pipe_latency_ms)
+        return 0
+
+    if args.reset:
+        shutil.rmtree(args.sink_dir, ignore_errors=True)
+
+    crash_before_commit = args.crash_after if args.crash_point == "persisted" else None
+    crash_after = args.crash_after if args.crash_point == "committed" else None
+    sink = LocalSink(args.sink_dir, crash_before_commit=crash_before_commit)
+    print(f"📡 Streaming {sum(len(r) for r in events.values()):,} events "
+          f"to {Path(args.sink_dir).absolute()} in batches of {args.batch_size}...")
+    try:
+        rows, _ = stream_events(sink, events, args.batch_size, crash_after, args.rate)
+    except SimulatedCrash as crash:
+        print(f"💥 {crash} - re-run without --crash-after to resume")
+        return 3
+
+    print(f"✅ Sent {rows:,} rows this run")
+    if not verify(sink, events):
+        return 1
+    print("🎉 All channels hold every event exactly once")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+from snowpipe_demo.connectors import RecordingConnector
+from snowpipe_demo.dag import Step, critical_path, run_dag
+from snowpipe_demo.entities import ENTITIES
+from snowpipe_demo.orchestrate import build_cycle
+from snowpipe_demo.sql import partition_statements, split_sql
+
+SQL_DIR = Path(__file__).resolve().parent.parent
+
+
+# =============================================================================
+# SQL SPLITTING
+# =============================================================================
+def test_split_sql_ignores_semicolons_in_quotes_and_comments():
+    text = """
+    -- header; with a semicolon
+    SELECT 'a;b' AS X;
+    /* block; comment */ CREATE TABLE T (ID NUMBER);
+    SELECT 1  -- trailing; comment
+    """
+    assert split_sql(text) == ["SELECT 'a;b' AS X", "CREATE TABLE T (ID NUMBER)", "SELECT 1"]
+
+
+def test_partition_statements_keeps_use_context(tmp_path):
+    (tmp_path / "script.sql").write_text(
+        "USE SCHEMA S;\n"
+        "CREATE TABLE STG_CUSTOMERS (ID NUMBER);\n"
+        "CREATE STAGE STG_SALES_TERRITORIES_FILES;\n"
+        "SELECT COUNT(*) FROM STG_CUSTOMERS UNION ALL SELECT COUNT(*) FROM STG_PRODUCTS;\n"
+    )
+    shared, per_dataset = partition_statements("script.sql", tmp_path)
+    assert per_dataset["customers"] == ["USE SCHEMA S", "CREATE TABLE STG_CUSTOMERS (ID NUMBER)"]
+    assert per_dataset["sales_territories"] == ["USE SCHEMA S", "CREATE STAGE STG_SALES_TERRITORIES_FILES"]
+    assert shared[0] == "USE SCHEMA S"
+    assert shared[1].startswith("SELECT COUNT(*) FROM STG_CUSTOMERS")
+
+    # Switching back to an earlier context must repeat its USE
+    (tmp_path / "switch.sql").write_text(
+        "USE SCHEMA A;\n"
+        "CREATE TABLE STG_CUSTOMERS (ID NUMBER);\n"
+        "USE SCHEMA B;\n"
+        "CREATE STAGE STG_CUSTOMERS_FILES;\n"
+        "USE SCHEMA A;\n"
+        "CREATE PIPE PIPE_CUSTOMERS AS COPY INTO STG_CUSTOMERS FROM @B.STG_CUSTOMERS_FILES;\n"
+    )
+    _, per_dataset = partition_statements("switch.sql", tmp_path)
+    assert per_dataset["customers"] == [
+        "USE SCHEMA A", "CREATE TABLE STG_CUSTOMERS (ID NUMBER)",
+        "USE SCHEMA B", "CREATE STAGE STG_CUSTOMERS_FILES",
+        "USE SCHEMA A", "CREATE PIPE PIPE_CUSTOMERS AS COPY INTO STG_CUSTOMERS FROM @B.STG_CUSTOMERS_FILES",
+    ]
+
+
+# =============================================================================
+# DAG RUNNER
+# =============================================================================
+def _sleep(seconds):
+    return lambda: time.sleep(seconds)
+
+
+def test_run_dag_respects_dependencies_and_reports_critical_path():
+    steps = [
+        Step("a", _sleep(0.01)),
+        Step("b", _sleep(0.05), ["a"]),
+        Step("c", _sleep(0.01), ["a"]),
+        Step("d", _sleep(0.01), ["b", "c"]),
+    ]
+    run_dag(steps, max_workers=2)
+    by_name = {step.name: step for step in steps}
+    for step in steps:
+        for dep in step.deps:
+            assert by_name[dep].end <= step.start
+    assert [step.name for step in critical_path(steps)] == ["a", "b", "d"]
+
+
+def test_run_dag_raises_on_failure_and_cycles():
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(RuntimeError, match="Step 'bad' failed: boom"):
+        run_dag([Step("bad", fail), Step("after", _sleep(0), ["bad"])])
+    with pytest.raises(ValueError, match="cycle"):
+        run_dag([Step("x", _sleep(0), ["y"]), Step("y", _sleep(0), ["x"])])
+    with pytest.raises(ValueError, match="unknown steps"):
+        run_dag([Step("x", _sleep(0), ["missing"])])
+
+
+# =============================================================================
+# ORCHESTRATED CYCLE
+# =============================================================================
+@pytest.fixture(scope="module")
+def recorded(tmp_path_factory):
+    connector = RecordingConnector()
+    steps = build_cycle(connector, tmp_path_factory.mktemp("data"), "compact", sql_dir=SQL_DIR)
+    run_dag(steps, max_workers=4)
+    return connector.statements
+
+
+def _statements(recorded):
+    return [statement for _, statement in recorded]
+
+
+def _created_tables(statements):
+    return {m.group(1) for s in statements for m in [re.match(r"CREATE OR REPLACE TABLE (\w+)", s)] if m}
+
+
+def test_cycle_creates_every_table_a_task_merges_into(recorded):
+    recorded = _statements(recorded)
+    targets = {m.group(1) for s in recorded for m in re.finditer(r"MERGE INTO \S+\.(LATEST_\w+)", s)}
+    assert len(targets) == len(ENTITIES)
+    assert targets <= _created_tables(recorded)
+
+
+def test_cycle_creates_every_table_pipes_and_streams_read(recorded):
+    recorded = _statements(recorded)
+    copy_targets = {m.group(1) for s in recorded for m in re.finditer(r"COPY INTO \S+\.(STG_\w+)", s)}
+    stream_sources = {m.group(1) for s in recorded
+                      for m in re.finditer(r"STREAM \w+\s+ON TABLE (?:\w+\.)*(\w+)", s)}
+    assert len(copy_targets) == len(ENTITIES)
+    assert copy_targets == stream_sources
+    assert copy_targets <= _created_tables(recorded)
+
+
+def test_cycle_refreshes_pipes_after_each_put(recorded):
+    per_thread = {}
+    for thread, statement in recorded:
+        per_thread.setdefault(thread, []).append(statement)
+    for statements in per_thread.values():
+        for i, statement in enumerate(statements):
+            if statement.startswith("PUT "):
+                assert re.match(r"ALTER PIPE \S+ REFRESH$", statements[i + 1])
+    recorded = _statements(recorded)
+    refreshed = {s for s in recorded if s.startswith("ALTER PIPE")}
+    created = {m.group(1) for s in recorded for m in [re.match(r"CREATE OR REPLACE PIPE (\w+)", s)] if m}
+    assert {s.split()[2].rsplit(".", 1)[1] for s in refreshed} == created